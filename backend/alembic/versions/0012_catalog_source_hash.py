@@ -0,0 +1,31 @@
+"""Add source_hash to catalog_products.
+
+Revision ID: 0012_catalog_source_hash
+Revises: 0011_add_barcode_to_products
+Create Date: 2026-10-15
+
+Digest of the source record a catalog product was seeded from; the seeder
+skips products whose digest is unchanged.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0012_catalog_source_hash"
+down_revision = "0011_add_barcode_to_products"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "catalog_products",
+        sa.Column("source_hash", sa.LargeBinary(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("catalog_products", "source_hash")
@@ -0,0 +1,36 @@
+"""Add trigram index for catalog substring search.
+
+Revision ID: 0014_catalog_display_name_trgm
+Revises: 0012_catalog_source_hash
+Create Date: 2026-10-15
+
+Catalog search filters with ``display_name ILIKE '%term%'``, which a btree
+cannot serve; a pg_trgm GIN index turns it into an index scan for terms of
+three or more characters. Like the search_vector GIN index, it lives only in
+migrations.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0014_catalog_display_name_trgm"
+down_revision = "0012_catalog_source_hash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_catalog_products_display_name_trgm",
+        "catalog_products",
+        ["display_name"],
+        postgresql_using="gin",
+        postgresql_ops={"display_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    # The extension is left installed; other objects may depend on it.
+    op.drop_index("ix_catalog_products_display_name_trgm", table_name="catalog_products")
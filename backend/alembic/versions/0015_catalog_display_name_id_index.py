@@ -0,0 +1,30 @@
+"""Add (display_name, id) index for catalog keyset pagination.
+
+Revision ID: 0015_catalog_display_name_id_index
+Revises: 0014_catalog_display_name_trgm
+Create Date: 2026-10-15
+
+Serves both the display_name ordering of the catalog list and the
+``(display_name, id) > cursor`` seek used by the ``after`` parameter.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0015_catalog_display_name_id_index"
+down_revision = "0014_catalog_display_name_trgm"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_catalog_products_display_name_id",
+        "catalog_products",
+        ["display_name", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_catalog_products_display_name_id", table_name="catalog_products")
@@ -12,10 +12,12 @@ class TimestampMixin:
         nullable=False,
         server_default=func.now(),
     )
+    # Wall-clock time of the write rather than the transaction start (now()), so
+    # rows committed after a sync read do not sort behind its (updated_at, id) cursor.
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=func.clock_timestamp(),
     )
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
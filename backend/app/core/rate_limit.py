@@ -5,6 +5,7 @@ Uses a sliding-window counter per client IP. No external dependencies.
 
 import time
 from collections import defaultdict
+from collections.abc import Callable
 
 from fastapi import HTTPException, Request, status
 
@@ -12,9 +13,15 @@ from fastapi import HTTPException, Request, status
 class RateLimiter:
     """Sliding-window rate limiter keyed by client IP."""
 
-    def __init__(self, max_requests: int, window_seconds: int) -> None:
+    def __init__(
+        self,
+        max_requests: int,
+        window_seconds: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self.max_requests = max_requests
         self.window_seconds = window_seconds
+        self._clock = clock
         self._hits: dict[str, list[float]] = defaultdict(list)
 
     def _client_ip(self, request: Request) -> str:
@@ -33,7 +40,7 @@ class RateLimiter:
             del self._hits[key]
 
     async def __call__(self, request: Request) -> None:
-        now = time.monotonic()
+        now = self._clock()
         key = self._client_ip(request)
         self._prune(key, now)
 
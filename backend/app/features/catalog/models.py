@@ -11,6 +11,7 @@ from sqlalchemy import (
     Enum,
     ForeignKey,
     Index,
+    LargeBinary,
     Numeric,
     Text,
     UniqueConstraint,
@@ -30,6 +31,7 @@ class CatalogProduct(Base):
     __table_args__ = (
         UniqueConstraint("source", "source_id", name="uq_catalog_products_source_source_id"),
         Index("ix_catalog_products_barcode", "barcode"),
+        Index("ix_catalog_products_display_name_id", "display_name", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -48,6 +50,9 @@ class CatalogProduct(Base):
 
     category: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    # Digest of the seed source record; only the seeder reads it.
+    source_hash: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True, deferred=True)
+
     search_vector: Mapped[Any] = mapped_column(  # PostgreSQL tsvector type
         TSVECTOR,
         Computed(
@@ -68,10 +73,14 @@ class CatalogProduct(Base):
         nullable=False,
     )
 
+    # Default first, then by label (same order as device product portions), so
+    # get_default_portion finds a loaded product's default on the first item.
+    # Queries opt in with selectinload(); an unplanned lazy load raises.
     portions: Mapped[list[CatalogPortion]] = relationship(
         "CatalogPortion",
         back_populates="product",
-        lazy="selectin",
+        lazy="raise",
+        order_by="(CatalogPortion.is_default.desc(), CatalogPortion.label.asc())",
     )
 
 
@@ -14,9 +14,10 @@ from app.features.catalog.schemas import (
     CatalogProductResponse,
 )
 from app.features.catalog.service import (
-    get_catalog_product,
+    catalog_product_response,
     get_catalog_product_by_barcode,
-    get_default_portion,
+    get_catalog_product_detail,
+    get_default_portions,
     list_catalog_products,
 )
 
@@ -30,12 +31,19 @@ async def catalog_products_list(
     search: str | None = Query(default=None, max_length=200, description="Filter by name substring"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    after: uuid.UUID | None = Query(
+        default=None, description="Id of the last product on the previous page (name order only)"
+    ),
     _device_id: uuid.UUID = Depends(get_current_device_id),
     session: AsyncSession = Depends(get_session),
 ) -> list[CatalogProductListItem]:
-    products = await list_catalog_products(
-        session, search=search, limit=limit, offset=offset
-    )
+    try:
+        products = await list_catalog_products(
+            session, search=search, limit=limit, offset=offset, after=after
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    defaults = await get_default_portions(session, catalog_product_ids=[p.id for p in products])
     return [
         CatalogProductListItem(
             id=p.id,
@@ -46,7 +54,7 @@ async def catalog_products_list(
             brand=p.brand,
             barcode=p.barcode,
             category=p.category,
-            default_portion=CatalogPortionResponse.model_validate(dp) if (dp := get_default_portion(p)) else None,
+            default_portion=CatalogPortionResponse.model_validate(dp) if (dp := defaults.get(p.id)) else None,
         )
         for p in products
     ]
@@ -61,20 +69,7 @@ async def catalog_products_get_by_barcode(
     product = await get_catalog_product_by_barcode(session, barcode=barcode)
     if product is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
-
-    dp = get_default_portion(product)
-    return CatalogProductResponse(
-        id=product.id,
-        source=product.source,
-        source_id=product.source_id,
-        name=product.name,
-        display_name=product.display_name,
-        brand=product.brand,
-        barcode=product.barcode,
-        category=product.category,
-        default_portion=CatalogPortionResponse.model_validate(dp) if dp else None,
-        portions=[CatalogPortionResponse.model_validate(p) for p in product.portions],
-    )
+    return catalog_product_response(product)
 
 
 @router.get("/products/{catalog_product_id}", response_model=CatalogProductResponse)
@@ -83,20 +78,7 @@ async def catalog_products_get(
     _device_id: uuid.UUID = Depends(get_current_device_id),
     session: AsyncSession = Depends(get_session),
 ) -> CatalogProductResponse:
-    product = await get_catalog_product(session, catalog_product_id=catalog_product_id)
-    if product is None:
+    detail = await get_catalog_product_detail(session, catalog_product_id=catalog_product_id)
+    if detail is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
-
-    dp = get_default_portion(product)
-    return CatalogProductResponse(
-        id=product.id,
-        source=product.source,
-        source_id=product.source_id,
-        name=product.name,
-        display_name=product.display_name,
-        brand=product.brand,
-        barcode=product.barcode,
-        category=product.category,
-        default_portion=CatalogPortionResponse.model_validate(dp) if dp else None,
-        portions=[CatalogPortionResponse.model_validate(p) for p in product.portions],
-    )
+    return detail
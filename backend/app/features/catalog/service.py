@@ -2,11 +2,19 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.cache import TTLCache
 from app.features.catalog.models import CatalogPortion, CatalogProduct
+from app.features.catalog.schemas import CatalogPortionResponse, CatalogProductResponse
+
+# Built detail responses by product id. Catalog rows only change when the
+# seeder runs (a separate process), so the TTL is what bounds staleness.
+_product_details: TTLCache[uuid.UUID, CatalogProductResponse] = TTLCache(
+    maxsize=10_000, ttl_seconds=300
+)
 
 
 def _escape_like(value: str) -> str:
@@ -15,16 +23,48 @@ def _escape_like(value: str) -> str:
 
 
 def get_default_portion(product: CatalogProduct) -> CatalogPortion | None:
-    """Return the default portion for a catalog product, or None."""
+    """Return the default portion for a catalog product, or None.
+
+    ``product.portions`` must already be loaded (``selectinload``); the
+    relationship raises instead of lazy loading.
+    """
     return next((p for p in product.portions if p.is_default), None)
 
 
+async def get_default_portions(
+    session: AsyncSession,
+    *,
+    catalog_product_ids: list[uuid.UUID],
+) -> dict[uuid.UUID, CatalogPortion]:
+    """Return the default portion of each given product, keyed by product id.
+
+    One query served by the partial unique index
+    ``uq_catalog_portions_default_per_product`` (migration 0008), instead of
+    loading every portion of every product just to pick the default. Products
+    without a default are absent from the result.
+    """
+    if not catalog_product_ids:
+        return {}
+    stmt = (
+        select(CatalogPortion)
+        .distinct(CatalogPortion.catalog_product_id)
+        .where(
+            CatalogPortion.catalog_product_id.in_(catalog_product_ids),
+            CatalogPortion.is_default.is_(True),
+        )
+        .order_by(CatalogPortion.catalog_product_id, CatalogPortion.label.asc())
+    )
+    result = await session.execute(stmt)
+    return {p.catalog_product_id: p for p in result.scalars()}
+
+
 async def list_catalog_products(
     session: AsyncSession,
     *,
     search: str | None,
     limit: int,
-    offset: int,
+    offset: int = 0,
+    after: uuid.UUID | None = None,
 ) -> list[CatalogProduct]:
     """Return catalog products, optionally filtered by search query.
 
@@ -33,13 +73,38 @@ async def list_catalog_products(
     - len(search) < 3: use ILIKE on display_name directly
     - No search: order by display_name ascending
 
+    The display_name ILIKE is backed by a pg_trgm GIN index (migration 0014) for
+    terms of three or more characters. Ties are broken by id so that offset
+    pages neither repeat nor skip rows.
+
+    ``after`` is a keyset cursor, the id of the last product on the previous
+    page. It seeks the ``(display_name, id)`` index instead of reading and
+    discarding ``offset`` rows, so it only applies to the display_name ordering;
+    combining it with a ranked search (3+ characters) raises ValueError.
+
+    Portions are not loaded; use ``get_default_portions`` for the list view.
+
     No device scoping — catalog is global.
     """
-    stmt = select(CatalogProduct).options(selectinload(CatalogProduct.portions))
+    stmt = select(CatalogProduct)
 
     if search:
         search = search.strip()
 
+    if after is not None:
+        if search and len(search) >= 3:
+            raise ValueError("after cannot be combined with a ranked search")
+        cursor = (
+            select(CatalogProduct.display_name, CatalogProduct.id)
+            .where(CatalogProduct.id == after)
+            .subquery()
+        )
+        stmt = stmt.join(
+            cursor,
+            tuple_(CatalogProduct.display_name, CatalogProduct.id)
+            > tuple_(cursor.c.display_name, cursor.c.id),
+        )
+
     if search:
         escaped = _escape_like(search)
 
@@ -62,7 +127,7 @@ async def list_catalog_products(
     if not search or len(search) < 3:
         stmt = stmt.order_by(CatalogProduct.display_name.asc())
 
-    stmt = stmt.limit(limit).offset(offset)
+    stmt = stmt.order_by(CatalogProduct.id).limit(limit).offset(offset)
 
     result = await session.execute(stmt)
     return list(result.scalars().all())
@@ -83,6 +148,49 @@ async def get_catalog_product(
     return result.scalars().first()
 
 
+def catalog_product_response(product: CatalogProduct) -> CatalogProductResponse:
+    """Build the detail response for a product whose portions are loaded."""
+    dp = get_default_portion(product)
+    return CatalogProductResponse(
+        id=product.id,
+        source=product.source,
+        source_id=product.source_id,
+        name=product.name,
+        display_name=product.display_name,
+        brand=product.brand,
+        barcode=product.barcode,
+        category=product.category,
+        default_portion=CatalogPortionResponse.model_validate(dp) if dp else None,
+        portions=[CatalogPortionResponse.model_validate(p) for p in product.portions],
+    )
+
+
+async def get_catalog_product_detail(
+    session: AsyncSession,
+    *,
+    catalog_product_id: uuid.UUID,
+) -> CatalogProductResponse | None:
+    """Return the detail response for a catalog product (cached), or None if not found.
+
+    Only found products are cached, so a product seeded later is never
+    reported missing.
+    """
+    detail = _product_details.get(catalog_product_id)
+    if detail is not None:
+        return detail
+    product = await get_catalog_product(session, catalog_product_id=catalog_product_id)
+    if product is None:
+        return None
+    detail = catalog_product_response(product)
+    _product_details.set(catalog_product_id, detail)
+    return detail
+
+
+def clear_catalog_cache() -> None:
+    """Forget every cached catalog detail response (used between tests)."""
+    _product_details.clear()
+
+
 async def get_catalog_product_by_barcode(
     session: AsyncSession,
     *,
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import uuid
-from datetime import UTC, datetime
 
-from sqlalchemy import update
+from sqlalchemy import func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.meals.models import FoodEntry
@@ -13,11 +12,12 @@ async def delete_all_food_entries(
     session: AsyncSession, *, device_id: uuid.UUID
 ) -> int:
     """Bulk soft-delete all food entries for a device. Returns count of rows updated."""
-    now = datetime.now(UTC)
+    # clock_timestamp(), not now(): the sync cursor orders on updated_at, and the
+    # transaction start time could sort these rows behind a cursor already served.
     stmt = (
         update(FoodEntry)
         .where(FoodEntry.device_id == device_id, FoodEntry.deleted_at.is_(None))
-        .values(deleted_at=now, updated_at=now)
+        .values(deleted_at=func.clock_timestamp(), updated_at=func.clock_timestamp())
         .execution_options(synchronize_session=False)
     )
     result = await session.execute(stmt)
@@ -247,7 +247,6 @@ async def update_goal(
     if water_ml is not None:
         goal.water_ml = water_ml
 
-    goal.updated_at = datetime.now(UTC)
     session.add(goal)
     await session.commit()
     await session.refresh(goal)
@@ -266,7 +265,6 @@ async def soft_delete_goal(
         return False
 
     goal.deleted_at = datetime.now(UTC)
-    goal.updated_at = datetime.now(UTC)
     session.add(goal)
     await session.commit()
     return True
@@ -285,7 +283,6 @@ async def _soft_delete_existing_goals(
     now = datetime.now(UTC)
     for goal in goals:
         goal.deleted_at = now
-        goal.updated_at = now
         session.add(goal)
 
     await session.flush()
@@ -7,33 +7,14 @@ from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.meals.models import FoodEntry
-from app.features.portions.models import ProductPortion
-from app.features.products.service import get_product
+from app.features.portions.service import get_portion_product_id
+from app.features.products.service import product_exists
 
 
 def _not_deleted(stmt: Select):
     return stmt.where(FoodEntry.deleted_at.is_(None))
 
 
-async def _get_portion(
-    session: AsyncSession,
-    *,
-    device_id: uuid.UUID,
-    portion_id: uuid.UUID,
-) -> ProductPortion | None:
-    stmt = (
-        select(ProductPortion)
-        .where(
-            ProductPortion.deleted_at.is_(None),
-            ProductPortion.device_id == device_id,
-            ProductPortion.id == portion_id,
-        )
-        .limit(1)
-    )
-    res = await session.execute(stmt)
-    return res.scalar_one_or_none()
-
-
 async def create_food_entry(
     session: AsyncSession,
     *,
@@ -45,12 +26,13 @@ async def create_food_entry(
     amount,
     unit,
 ) -> FoodEntry | None:
-    product = await get_product(session, device_id=device_id, product_id=product_id)
-    if product is None:
+    if not await product_exists(session, device_id=device_id, product_id=product_id):
         return None
 
-    portion = await _get_portion(session, device_id=device_id, portion_id=portion_id)
-    if portion is None or portion.product_id != product_id:
+    portion_product_id = await get_portion_product_id(
+        session, device_id=device_id, portion_id=portion_id
+    )
+    if portion_product_id != product_id:
         return None
 
     entry = FoodEntry(
@@ -63,8 +45,8 @@ async def create_food_entry(
         unit=unit,
     )
     session.add(entry)
+    # INSERT ... RETURNING already loaded the server defaults; no refresh needed
     await session.commit()
-    await session.refresh(entry)
     return entry
 
 
@@ -111,13 +93,14 @@ async def update_food_entry(
         return None
 
     if "portion_id" in patch:
-        portion = await _get_portion(session, device_id=device_id, portion_id=patch["portion_id"])
-        if portion is None or portion.product_id != entry.product_id:
+        portion_product_id = await get_portion_product_id(
+            session, device_id=device_id, portion_id=patch["portion_id"]
+        )
+        if portion_product_id != entry.product_id:
             return None
 
     for k, v in patch.items():
         setattr(entry, k, v)
-    entry.updated_at = datetime.now(UTC)
     session.add(entry)
     await session.commit()
     await session.refresh(entry)
@@ -135,7 +118,6 @@ async def soft_delete_food_entry(
         return False
 
     entry.deleted_at = datetime.now(UTC)
-    entry.updated_at = datetime.now(UTC)
     session.add(entry)
     await session.commit()
     return True
@@ -1,34 +1,67 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import AsyncIterator, Sequence
 from datetime import UTC, datetime
 
-from sqlalchemy import Select, select, update
+from sqlalchemy import Select, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, load_only
 
 from app.features.portions.models import ProductPortion
-from app.features.products.service import get_product
+from app.features.products.service import product_exists
 
 
 def _not_deleted(stmt: Select):
     return stmt.where(ProductPortion.deleted_at.is_(None))
 
 
-async def list_portions(
-    session: AsyncSession,
+def _list_portions_stmt(
     *,
     device_id: uuid.UUID,
     product_id: uuid.UUID,
-) -> list[ProductPortion]:
+    fields: Sequence[InstrumentedAttribute] | None = None,
+) -> Select:
     stmt = (
         _not_deleted(select(ProductPortion))
         .where(ProductPortion.device_id == device_id, ProductPortion.product_id == product_id)
         .order_by(ProductPortion.is_default.desc(), ProductPortion.label.asc())
     )
+    if fields:
+        stmt = stmt.options(load_only(*fields))
+    return stmt
+
+
+async def list_portions(
+    session: AsyncSession,
+    *,
+    device_id: uuid.UUID,
+    product_id: uuid.UUID,
+    fields: Sequence[InstrumentedAttribute] | None = None,
+) -> list[ProductPortion]:
+    """Return non-deleted portions, default first.
+
+    ``fields`` restricts the SELECT to the given columns (plus the primary key);
+    unloaded attributes must not be touched afterwards under async IO.
+    """
+    stmt = _list_portions_stmt(device_id=device_id, product_id=product_id, fields=fields)
     res = await session.execute(stmt)
     return list(res.scalars().all())
 
 
+async def iter_portions(
+    session: AsyncSession,
+    *,
+    device_id: uuid.UUID,
+    product_id: uuid.UUID,
+) -> AsyncIterator[ProductPortion]:
+    """Stream portions one at a time for callers that iterate the result once."""
+    stmt = _list_portions_stmt(device_id=device_id, product_id=product_id)
+    res = await session.stream(stmt)
+    async for portion in res.scalars():
+        yield portion
+
+
 async def get_portion(
     session: AsyncSession,
     *,
@@ -43,6 +76,20 @@ async def get_portion(
     return res.scalar_one_or_none()
 
 
+async def get_portion_product_id(
+    session: AsyncSession,
+    *,
+    device_id: uuid.UUID,
+    portion_id: uuid.UUID,
+) -> uuid.UUID | None:
+    """Return the product id of a non-deleted portion owned by the device (uncached)."""
+    stmt = _not_deleted(select(ProductPortion.product_id)).where(
+        ProductPortion.device_id == device_id,
+        ProductPortion.id == portion_id,
+    )
+    return (await session.execute(stmt)).scalar_one_or_none()
+
+
 async def create_portion(
     session: AsyncSession,
     *,
@@ -57,11 +104,12 @@ async def create_portion(
     fat,
     is_default: bool,
 ) -> ProductPortion | None:
-    product = await get_product(session, device_id=device_id, product_id=product_id)
-    if product is None:
+    if not await product_exists(session, device_id=device_id, product_id=product_id):
         return None
 
-    existing = await list_portions(session, device_id=device_id, product_id=product_id)
+    existing = await list_portions(
+        session, device_id=device_id, product_id=product_id, fields=(ProductPortion.id,)
+    )
     should_be_default = True if len(existing) == 0 else is_default
 
     portion = ProductPortion(
@@ -88,7 +136,7 @@ async def create_portion(
                 ProductPortion.id != portion.id,
                 ProductPortion.deleted_at.is_(None),
             )
-            .values(is_default=False, updated_at=datetime.now(UTC))
+            .values(is_default=False, updated_at=func.clock_timestamp())
         )
 
     await session.commit()
@@ -117,7 +165,6 @@ async def update_portion(
 
     for k, v in patch.items():
         setattr(portion, k, v)
-    portion.updated_at = datetime.now(UTC)
     session.add(portion)
     await session.flush()
 
@@ -130,7 +177,7 @@ async def update_portion(
                 ProductPortion.id != portion.id,
                 ProductPortion.deleted_at.is_(None),
             )
-            .values(is_default=False, updated_at=datetime.now(UTC))
+            .values(is_default=False, updated_at=func.clock_timestamp())
         )
 
     await session.commit()
@@ -164,11 +211,9 @@ async def soft_delete_portion(
         if replacement is None:
             raise PortionConflict("Cannot delete the only default portion.")
         replacement.is_default = True
-        replacement.updated_at = datetime.now(UTC)
         session.add(replacement)
 
     portion.deleted_at = datetime.now(UTC)
-    portion.updated_at = datetime.now(UTC)
     portion.is_default = False
     session.add(portion)
     await session.commit()
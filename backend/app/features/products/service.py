@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from decimal import Decimal
 
@@ -8,6 +9,7 @@ from sqlalchemy import Select, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.catalog.models import CatalogPortion, CatalogProduct
+from app.features.catalog.service import get_default_portions
 from app.features.products.models import Product
 from app.features.products.schemas import ProductSearchResultItem
 
@@ -53,16 +55,26 @@ async def create_product(
     return product
 
 
-async def list_products(session: AsyncSession, *, device_id: uuid.UUID) -> list[Product]:
-    stmt = (
+def _list_products_stmt(*, device_id: uuid.UUID) -> Select:
+    return (
         _not_deleted(select(Product))
         .where(Product.device_id == device_id)
         .order_by(Product.name.asc())
     )
-    res = await session.execute(stmt)
+
+
+async def list_products(session: AsyncSession, *, device_id: uuid.UUID) -> list[Product]:
+    res = await session.execute(_list_products_stmt(device_id=device_id))
     return list(res.scalars().all())
 
 
+async def iter_products(session: AsyncSession, *, device_id: uuid.UUID) -> AsyncIterator[Product]:
+    """Stream products one at a time for callers that iterate the result once."""
+    res = await session.stream(_list_products_stmt(device_id=device_id))
+    async for product in res.scalars():
+        yield product
+
+
 async def get_product(
     session: AsyncSession, *, device_id: uuid.UUID, product_id: uuid.UUID
 ) -> Product | None:
@@ -73,6 +85,20 @@ async def get_product(
     return res.scalar_one_or_none()
 
 
+async def product_exists(
+    session: AsyncSession, *, device_id: uuid.UUID, product_id: uuid.UUID
+) -> bool:
+    """Return True if the device owns a non-deleted product with this id.
+
+    Deliberately uncached: callers gate writes on it, and a cached hit could
+    outlive a soft delete committed by another worker.
+    """
+    stmt = _not_deleted(select(Product.id)).where(
+        Product.device_id == device_id, Product.id == product_id
+    )
+    return (await session.execute(stmt)).scalar_one_or_none() is not None
+
+
 async def update_product(
     session: AsyncSession,
     *,
@@ -89,7 +115,6 @@ async def update_product(
         product.name = name
     if barcode is not None:
         product.barcode = barcode
-    product.updated_at = datetime.now(UTC)
     session.add(product)
 
     await session.commit()
@@ -175,12 +200,13 @@ async def search_products(
     )
     catalog_res = await session.execute(catalog_stmt)
     catalog_products = list(catalog_res.scalars().all())
+    defaults = await get_default_portions(
+        session, catalog_product_ids=[cp.id for cp in catalog_products]
+    )
 
     catalog_results = []
     for cp in catalog_products:
-        default_portion: CatalogPortion | None = next(
-            (port for port in cp.portions if port.is_default), None
-        )
+        default_portion: CatalogPortion | None = defaults.get(cp.id)
         calories_per_100g: float | None = None
         protein_per_100g: float | None = None
         carbs_per_100g: float | None = None
@@ -228,7 +254,6 @@ async def soft_delete_product(
         return False
 
     product.deleted_at = datetime.now(UTC)
-    product.updated_at = datetime.now(UTC)
     session.add(product)
     await session.commit()
     return True
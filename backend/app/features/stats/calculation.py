@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from decimal import Decimal
+from collections.abc import Iterable
+from decimal import Context, Decimal, Inexact
+from typing import NamedTuple
 
 from app.core.enums import Unit
 
+_ZERO = Decimal(0)
+
 _MASS_TO_G: dict[Unit, Decimal] = {
     Unit.mg: Decimal("0.001"),
     Unit.g: Decimal("1"),
@@ -20,12 +23,28 @@ _VOLUME_TO_ML: dict[Unit, Decimal] = {
 }
 
 
-def _is_mass(u: Unit) -> bool:
-    return u in _MASS_TO_G
+def _direct_factors(to_base: dict[Unit, Decimal]) -> dict[tuple[Unit, Unit], tuple[Decimal, bool]]:
+    """Build one exact factor for every ordered pair of units in a group.
+
+    ``(factor, True)`` means multiply by ``factor``, ``(factor, False)`` means divide.
+    The direction that divides exactly is picked (e.g. tsp -> cup divides by 48
+    instead of multiplying by 0.02083...), so a single operation yields the same
+    value as going through the base unit.
+    """
+    exact = Context(traps=[Inexact])
+    factors: dict[tuple[Unit, Unit], tuple[Decimal, bool]] = {}
+    for src, src_base in to_base.items():
+        for dst, dst_base in to_base.items():
+            if src == dst:
+                continue
+            try:
+                factors[src, dst] = (exact.divide(src_base, dst_base), True)
+            except Inexact:
+                factors[src, dst] = (exact.divide(dst_base, src_base), False)
+    return factors
 
 
-def _is_volume(u: Unit) -> bool:
-    return u in _VOLUME_TO_ML
+_FACTORS = {**_direct_factors(_MASS_TO_G), **_direct_factors(_VOLUME_TO_ML)}
 
 
 def convert_unit(amount: Decimal, from_unit: Unit, to_unit: Unit) -> Decimal:
@@ -33,25 +52,34 @@ def convert_unit(amount: Decimal, from_unit: Unit, to_unit: Unit) -> Decimal:
     if from_unit == to_unit:
         return amount
 
-    if _is_mass(from_unit) and _is_mass(to_unit):
-        in_g = amount * _MASS_TO_G[from_unit]
-        return in_g / _MASS_TO_G[to_unit]
-
-    if _is_volume(from_unit) and _is_volume(to_unit):
-        in_ml = amount * _VOLUME_TO_ML[from_unit]
-        return in_ml / _VOLUME_TO_ML[to_unit]
+    direct = _FACTORS.get((from_unit, to_unit))
+    if direct is None:
+        raise ValueError(f"Incompatible units: {from_unit} -> {to_unit}")
 
-    raise ValueError(f"Incompatible units: {from_unit} -> {to_unit}")
+    factor, multiply = direct
+    return amount * factor if multiply else amount / factor
 
 
-@dataclass(frozen=True)
-class MacroTotals:
+class MacroTotals(NamedTuple):
     calories: Decimal
     protein: Decimal
     carbs: Decimal
     fat: Decimal
 
 
+_ZERO_TOTALS = MacroTotals(calories=_ZERO, protein=_ZERO, carbs=_ZERO, fat=_ZERO)
+
+
+def sum_totals(items: Iterable[MacroTotals]) -> MacroTotals:
+    """Add up many totals column by column (all zeros when empty).
+
+    ``zip`` transposes the rows and each column is reduced by one ``sum`` call,
+    instead of allocating an intermediate MacroTotals per addition.
+    """
+    columns = [sum(column, _ZERO) for column in zip(*items, strict=True)]
+    return MacroTotals._make(columns) if columns else _ZERO_TOTALS
+
+
 def calc_totals_for_entry(
     *,
     entry_amount: Decimal,
@@ -63,12 +91,17 @@ def calc_totals_for_entry(
     portion_carbs: Decimal | None,
     portion_fat: Decimal | None,
 ) -> MacroTotals:
-    consumed_in_portion_unit = convert_unit(entry_amount, entry_unit, portion_base_unit)
+    # Entries are usually logged in the portion's own unit; skip the call then
+    consumed_in_portion_unit = (
+        entry_amount
+        if entry_unit == portion_base_unit
+        else convert_unit(entry_amount, entry_unit, portion_base_unit)
+    )
     factor = consumed_in_portion_unit / portion_base_amount
 
-    protein = (portion_protein or Decimal("0")) * factor
-    carbs = (portion_carbs or Decimal("0")) * factor
-    fat = (portion_fat or Decimal("0")) * factor
+    protein = (portion_protein or _ZERO) * factor
+    carbs = (portion_carbs or _ZERO) * factor
+    fat = (portion_fat or _ZERO) * factor
     calories = portion_calories * factor
 
     return MacroTotals(
@@ -17,7 +17,7 @@ from app.features.stats.schemas import (
     WeightStatsResponse,
 )
 from app.features.stats.service import get_daily_stats, get_day_stats
-from app.features.weights.service import list_body_weights
+from app.features.weights.service import iter_body_weights
 
 router = APIRouter(prefix="/stats", tags=["stats"])
 
@@ -62,9 +62,9 @@ async def stats_weight(
     device_id: uuid.UUID = Depends(get_current_device_id),
     session: AsyncSession = Depends(get_session),
 ) -> WeightStatsResponse:
-    rows = await list_body_weights(session, device_id=device_id, from_day=from_day, to_day=to_day)
+    rows = iter_body_weights(session, device_id=device_id, from_day=from_day, to_day=to_day)
     return WeightStatsResponse(
         from_day=from_day,
         to_day=to_day,
-        points=[WeightPoint(day=r.day, weight_kg=r.weight_kg) for r in rows],
+        points=[WeightPoint(day=r.day, weight_kg=r.weight_kg) async for r in rows],
     )
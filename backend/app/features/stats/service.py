@@ -3,7 +3,6 @@ from __future__ import annotations
 import uuid
 from collections import defaultdict
 from datetime import date, timedelta
-from decimal import Decimal
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,25 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.enums import MealType
 from app.features.meals.models import FoodEntry
 from app.features.portions.models import ProductPortion
-from app.features.stats.calculation import MacroTotals, calc_totals_for_entry
-
-
-def _zero() -> MacroTotals:
-    return MacroTotals(
-        calories=Decimal("0"),
-        protein=Decimal("0"),
-        carbs=Decimal("0"),
-        fat=Decimal("0"),
-    )
-
-
-def _add(a: MacroTotals, b: MacroTotals) -> MacroTotals:
-    return MacroTotals(
-        calories=a.calories + b.calories,
-        protein=a.protein + b.protein,
-        carbs=a.carbs + b.carbs,
-        fat=a.fat + b.fat,
-    )
+from app.features.stats.calculation import MacroTotals, calc_totals_for_entry, sum_totals
 
 
 async def get_day_stats(
@@ -38,8 +19,20 @@ async def get_day_stats(
     device_id: uuid.UUID,
     day: date,
 ) -> tuple[MacroTotals, dict[MealType, MacroTotals]]:
+    # Select bare columns: rows come back as plain tuples, skipping ORM
+    # hydration and identity-map bookkeeping for every entry of the day.
     stmt = (
-        select(FoodEntry, ProductPortion)
+        select(
+            FoodEntry.amount,
+            FoodEntry.unit,
+            FoodEntry.meal_type,
+            ProductPortion.base_amount,
+            ProductPortion.base_unit,
+            ProductPortion.calories,
+            ProductPortion.protein,
+            ProductPortion.carbs,
+            ProductPortion.fat,
+        )
         .join(ProductPortion, ProductPortion.id == FoodEntry.portion_id)
         .where(
             FoodEntry.device_id == device_id,
@@ -50,24 +43,25 @@ async def get_day_stats(
     )
     res = await session.execute(stmt)
 
-    totals = _zero()
-    by_meal: dict[MealType, MacroTotals] = defaultdict(_zero)
+    # Collect per meal and reduce once at the end rather than re-adding per entry
+    by_meal: dict[MealType, list[MacroTotals]] = defaultdict(list)
 
-    for entry, portion in res.all():
-        entry_totals = calc_totals_for_entry(
-            entry_amount=entry.amount,
-            entry_unit=entry.unit,
-            portion_base_amount=portion.base_amount,
-            portion_base_unit=portion.base_unit,
-            portion_calories=portion.calories,
-            portion_protein=portion.protein,
-            portion_carbs=portion.carbs,
-            portion_fat=portion.fat,
+    for amount, unit, meal_type, base_amount, base_unit, calories, protein, carbs, fat in res:
+        by_meal[meal_type].append(
+            calc_totals_for_entry(
+                entry_amount=amount,
+                entry_unit=unit,
+                portion_base_amount=base_amount,
+                portion_base_unit=base_unit,
+                portion_calories=calories,
+                portion_protein=protein,
+                portion_carbs=carbs,
+                portion_fat=fat,
+            )
         )
-        totals = _add(totals, entry_totals)
-        by_meal[entry.meal_type] = _add(by_meal[entry.meal_type], entry_totals)
 
-    return totals, dict(by_meal)
+    meal_totals = {meal: sum_totals(entries) for meal, entries in by_meal.items()}
+    return sum_totals(meal_totals.values()), meal_totals
 
 
 async def get_daily_stats(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import AsyncIterator
 from datetime import UTC, date, datetime
 
 from sqlalchemy import Select, select
@@ -36,23 +37,46 @@ async def create_body_weight(
     return row
 
 
-async def list_body_weights(
-    session: AsyncSession,
+def _list_body_weights_stmt(
     *,
     device_id: uuid.UUID,
-    from_day: date | None = None,
-    to_day: date | None = None,
-) -> list[BodyWeight]:
+    from_day: date | None,
+    to_day: date | None,
+) -> Select:
     stmt = _not_deleted(select(BodyWeight)).where(BodyWeight.device_id == device_id)
     if from_day is not None:
         stmt = stmt.where(BodyWeight.day >= from_day)
     if to_day is not None:
         stmt = stmt.where(BodyWeight.day <= to_day)
-    stmt = stmt.order_by(BodyWeight.day.asc())
+    return stmt.order_by(BodyWeight.day.asc())
+
+
+async def list_body_weights(
+    session: AsyncSession,
+    *,
+    device_id: uuid.UUID,
+    from_day: date | None = None,
+    to_day: date | None = None,
+) -> list[BodyWeight]:
+    stmt = _list_body_weights_stmt(device_id=device_id, from_day=from_day, to_day=to_day)
     res = await session.execute(stmt)
     return list(res.scalars().all())
 
 
+async def iter_body_weights(
+    session: AsyncSession,
+    *,
+    device_id: uuid.UUID,
+    from_day: date | None = None,
+    to_day: date | None = None,
+) -> AsyncIterator[BodyWeight]:
+    """Stream weights one at a time for callers that iterate the result once."""
+    stmt = _list_body_weights_stmt(device_id=device_id, from_day=from_day, to_day=to_day)
+    res = await session.stream(stmt)
+    async for row in res.scalars():
+        yield row
+
+
 async def get_body_weight(
     session: AsyncSession,
     *,
@@ -86,7 +110,6 @@ async def update_body_weight(
     if row is None:
         return None
     row.weight_kg = weight_kg
-    row.updated_at = datetime.now(UTC)
     session.add(row)
     await session.commit()
     await session.refresh(row)
@@ -103,7 +126,6 @@ async def soft_delete_body_weight(
     if row is None:
         return False
     row.deleted_at = datetime.now(UTC)
-    row.updated_at = datetime.now(UTC)
     session.add(row)
     await session.commit()
     return True
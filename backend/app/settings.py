@@ -24,6 +24,12 @@ class Settings(BaseSettings):
 
     database_url: str = "postgresql+asyncpg://countonme:countonme@db:5432/countonme"
 
+    # Connection pool / asyncpg prepared-statement cache
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_pre_ping: bool = False
+    db_statement_cache_size: int = 1024
+
     device_token_pepper: str  # Required — no default; must be set via env var
 
 
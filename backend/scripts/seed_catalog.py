@@ -2,6 +2,7 @@
 
 Usage (from backend/ directory):
     python -m scripts.seed_catalog [--seeds-dir PATH] [--sources {usda,off,all}] [--dry-run]
+                                   [--rebuild-indexes] [--low-memory]
 
 Delegates to source-specific seeders:
 - USDA: reads SR Legacy JSON, cleans names, upserts products + portions
@@ -15,11 +16,12 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import logging
 import os
-import re
 import sys
 from pathlib import Path
+from typing import Any
 
 from scripts.seeders.off import OffSeeder
 from scripts.seeders.usda import UsdaSeeder
@@ -40,14 +42,19 @@ logger = logging.getLogger(__name__)
 # Database URL helpers
 # ---------------------------------------------------------------------------
 
+# Scheme prefixes rewritten to plain postgresql://
+_URL_PREFIXES: tuple[str, ...] = ("postgresql+asyncpg://", "postgres+asyncpg://", "postgres://")
+
+
 def _asyncpg_url(url: str) -> str:
     """Convert any postgres URL variant to a plain asyncpg-compatible URL."""
-    url = re.sub(r"^postgresql\+asyncpg://", "postgresql://", url)
-    url = re.sub(r"^postgres\+asyncpg://", "postgresql://", url)
-    url = re.sub(r"^postgres://", "postgresql://", url)
+    for prefix in _URL_PREFIXES:
+        if url.startswith(prefix):
+            return "postgresql://" + url[len(prefix):]
     return url
 
 
+@functools.lru_cache(maxsize=1)
 def _load_database_url() -> str:
     """Read DATABASE_URL from env or .env file at repo root."""
     url = os.environ.get("DATABASE_URL")
@@ -71,11 +78,56 @@ def _load_database_url() -> str:
     )
 
 
+# ---------------------------------------------------------------------------
+# Secondary indexes
+# ---------------------------------------------------------------------------
+
+# Non-unique catalog indexes as created by the migrations. With --rebuild-indexes
+# they are dropped before loading and built once at the end instead of being
+# maintained row by row. Unique indexes stay: the merge relies on them for
+# ON CONFLICT and for the one-default-portion-per-product rule.
+_SECONDARY_INDEXES: dict[str, str] = {
+    "ix_catalog_portions_catalog_product_id":
+        "CREATE INDEX ix_catalog_portions_catalog_product_id "
+        "ON catalog_portions (catalog_product_id)",
+    "ix_catalog_products_name":
+        "CREATE INDEX ix_catalog_products_name ON catalog_products (name)",
+    "ix_catalog_products_display_name_id":
+        "CREATE INDEX ix_catalog_products_display_name_id "
+        "ON catalog_products (display_name, id)",
+    "ix_catalog_products_barcode":
+        "CREATE INDEX ix_catalog_products_barcode ON catalog_products (barcode)",
+    "ix_catalog_products_search_vector":
+        "CREATE INDEX ix_catalog_products_search_vector "
+        "ON catalog_products USING gin (search_vector)",
+    "ix_catalog_products_display_name_trgm":
+        "CREATE INDEX ix_catalog_products_display_name_trgm "
+        "ON catalog_products USING gin (display_name gin_trgm_ops)",
+}
+
+
+async def _drop_secondary_indexes(conn: Any) -> None:
+    for name in _SECONDARY_INDEXES:
+        await conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+async def _create_secondary_indexes(conn: Any) -> None:
+    for ddl in _SECONDARY_INDEXES.values():
+        await conn.execute(ddl)
+
+
 # ---------------------------------------------------------------------------
 # Seed logic (async, using asyncpg)
 # ---------------------------------------------------------------------------
 
-async def _seed_async(seeds_dir: str, *, sources: str, dry_run: bool) -> None:
+async def _seed_async(
+    seeds_dir: str,
+    *,
+    sources: str,
+    dry_run: bool,
+    rebuild_indexes: bool = False,
+    low_memory: bool = False,
+) -> None:
     """Async seeding routine — delegates to source-specific seeders."""
     import asyncpg  # type: ignore[import-untyped]
 
@@ -85,7 +137,7 @@ async def _seed_async(seeds_dir: str, *, sources: str, dry_run: bool) -> None:
     if dry_run:
         # Dry-run doesn't need a DB connection
         if run_usda:
-            usda = UsdaSeeder(seeds_dir)
+            usda = UsdaSeeder(seeds_dir, low_memory=low_memory)
             products, portions = await usda.run(None, dry_run=True)  # type: ignore[arg-type]
             logger.info("[dry-run] USDA: %d products would be seeded.", products)
         if run_off:
@@ -98,14 +150,23 @@ async def _seed_async(seeds_dir: str, *, sources: str, dry_run: bool) -> None:
     conn = await asyncpg.connect(database_url)
     try:
         async with conn.transaction():
+            # Don't wait for the WAL flush at commit: a seed lost to a crash is
+            # simply re-run. (The COPY staging tables are TEMP, so already WAL-free.)
+            await conn.execute("SET LOCAL synchronous_commit = off")
+            if rebuild_indexes:
+                # Transactional DDL: a failed seed rolls the indexes back too.
+                await _drop_secondary_indexes(conn)
             if run_usda:
-                usda = UsdaSeeder(seeds_dir)
+                usda = UsdaSeeder(seeds_dir, low_memory=low_memory)
                 products, portions = await usda.run(conn, dry_run=False)
                 logger.info("USDA: %d products, %d portions seeded.", products, portions)
             if run_off:
                 off = OffSeeder(seeds_dir)
                 products, portions = await off.run(conn, dry_run=False)
                 logger.info("OFF: %d products, %d portions seeded.", products, portions)
+            if rebuild_indexes:
+                logger.info("Rebuilding secondary catalog indexes ...")
+                await _create_secondary_indexes(conn)
     except Exception:
         logger.exception("Seed failed — rolled back all changes.")
         sys.exit(1)
@@ -115,8 +176,23 @@ async def _seed_async(seeds_dir: str, *, sources: str, dry_run: bool) -> None:
     print("Seed complete.")  # noqa: T201
 
 
-def seed(seeds_dir: str, *, sources: str, dry_run: bool) -> None:
-    asyncio.run(_seed_async(seeds_dir, sources=sources, dry_run=dry_run))
+def seed(
+    seeds_dir: str,
+    *,
+    sources: str,
+    dry_run: bool,
+    rebuild_indexes: bool = False,
+    low_memory: bool = False,
+) -> None:
+    asyncio.run(
+        _seed_async(
+            seeds_dir,
+            sources=sources,
+            dry_run=dry_run,
+            rebuild_indexes=rebuild_indexes,
+            low_memory=low_memory,
+        )
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -148,6 +224,22 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Parse and validate without writing to the database.",
     )
+    parser.add_argument(
+        "--rebuild-indexes",
+        action="store_true",
+        help=(
+            "Drop secondary catalog indexes before loading and rebuild them after. "
+            "Faster for full loads; locks the catalog tables for the whole run."
+        ),
+    )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help=(
+            "Stream the USDA JSON with ijson instead of decoding it whole with orjson. "
+            "Keeps peak memory flat; the decode is slower."
+        ),
+    )
     return parser.parse_args(argv)
 
 
@@ -155,4 +247,10 @@ if __name__ == "__main__":
     args = _parse_args()
     if args.db_url:
         os.environ["DATABASE_URL"] = args.db_url
-    seed(args.seeds_dir, sources=args.sources, dry_run=args.dry_run)
+    seed(
+        args.seeds_dir,
+        sources=args.sources,
+        dry_run=args.dry_run,
+        rebuild_indexes=args.rebuild_indexes,
+        low_memory=args.low_memory,
+    )
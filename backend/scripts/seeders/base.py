@@ -7,6 +7,7 @@ are defined here so both USDA and OFF seeders can reuse them.
 
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -54,6 +55,13 @@ _UNIT_ALIASES: dict[str, str] = {
     "package": "serving",
 }
 
+# Single-hit lookup: every alias that resolves to a supported unit, plus the
+# supported units themselves.
+_UNIT_LOOKUP: dict[str, str] = {
+    **{alias: unit for alias, unit in _UNIT_ALIASES.items() if unit in SUPPORTED_UNITS},
+    **{unit: unit for unit in SUPPORTED_UNITS},
+}
+
 # ---------------------------------------------------------------------------
 # USDA nutrient extraction
 # ---------------------------------------------------------------------------
@@ -66,14 +74,17 @@ _TARGET_NUTRIENTS: dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=256)
 def normalize_unit(abbr: str | None, name: str | None) -> str | None:
-    """Return a supported unit string or ``None`` if unrecognised."""
+    """Return a supported unit string or ``None`` if unrecognised.
+
+    Memoized: seed files repeat the same handful of unit strings thousands of times.
+    """
     for candidate in (abbr, name):
         if candidate is None:
             continue
-        cleaned = candidate.strip().lower()
-        mapped = _UNIT_ALIASES.get(cleaned, cleaned)
-        if mapped in SUPPORTED_UNITS:
+        mapped = _UNIT_LOOKUP.get(candidate.strip().lower())
+        if mapped is not None:
             return mapped
     return None
 
@@ -86,12 +97,19 @@ def extract_macros_per_100g(food: dict[str, Any]) -> dict[str, float | None]:
         "protein_g_100g": None,
         "kcal_100g": None,
     }
-    for fn in food.get("foodNutrients", []):
-        nutrient_name: str | None = (fn.get("nutrient") or {}).get("name")
+    # Foods list dozens of nutrients; resolve each with one dict lookup and skip the
+    # rest without building intermediates. No early exit: names can repeat (Energy is
+    # listed in kcal and kJ) and the last occurrence has always been the one kept.
+    target_get = _TARGET_NUTRIENTS.get
+    for fn in food.get("foodNutrients", ()):
+        nutrient = fn.get("nutrient")
+        if not nutrient:
+            continue
+        key = target_get(nutrient.get("name"))
+        if key is None:
+            continue
         amount = fn.get("amount")
-        if nutrient_name in _TARGET_NUTRIENTS:
-            key = _TARGET_NUTRIENTS[nutrient_name]
-            macros[key] = float(amount) if amount is not None else None
+        macros[key] = float(amount) if amount is not None else None
     return macros
 
 
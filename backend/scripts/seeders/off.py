@@ -50,6 +50,67 @@ def parse_serving_size(raw: str) -> tuple[str, float | None]:
     return (raw, None)
 
 
+# Products whose portions are buffered before each DELETE + unnest INSERT;
+# bounds memory and statement size on the full dump, as in the USDA seeder.
+_PORTION_BATCH = 10_000
+
+_USDA_NAME_EXISTS_SQL = """
+    SELECT 1 FROM catalog_products
+    WHERE source = 'usda'
+      AND lower(trim(display_name)) = lower(trim($1))
+    LIMIT 1
+"""
+
+_UPSERT_PRODUCT_SQL = """
+    INSERT INTO catalog_products
+        (id, source, source_id, name, display_name, brand, barcode,
+         category, created_at, updated_at)
+    VALUES
+        (gen_random_uuid(), 'off', $1, $2, $2, $3, $4,
+         NULL, now(), now())
+    ON CONFLICT (source, source_id) DO UPDATE SET
+        name = EXCLUDED.name,
+        display_name = EXCLUDED.display_name,
+        brand = EXCLUDED.brand,
+        barcode = EXCLUDED.barcode,
+        updated_at = now()
+    RETURNING id
+"""
+
+
+async def _replace_portions(
+    conn: Any, portion_rows: dict[uuid.UUID, list[tuple[Any, ...]]],
+) -> None:
+    """Replace the portions of every product in one batch in two statements.
+
+    One ``DELETE ... = ANY`` plus one ``INSERT ... SELECT FROM unnest(...)`` over
+    column arrays, instead of a DELETE per product and an INSERT per portion.
+    """
+    await conn.execute(
+        "DELETE FROM catalog_portions WHERE catalog_product_id = ANY($1::uuid[])",
+        list(portion_rows),
+    )
+    columns = list(zip(*(r for rows in portion_rows.values() for r in rows), strict=True))
+    await conn.execute(
+        """
+        INSERT INTO catalog_portions
+            (id, catalog_product_id, label, base_amount, base_unit,
+             gram_weight, calories, protein, carbs, fat,
+             is_default, created_at, updated_at)
+        SELECT
+            gen_random_uuid(), u.product_id, u.label, u.base_amount, u.base_unit::unit_enum,
+            u.gram_weight, u.calories, u.protein, u.carbs, u.fat,
+            u.is_default, now(), now()
+        FROM unnest(
+            $1::uuid[], $2::text[], $3::numeric[], $4::text[], $5::numeric[],
+            $6::numeric[], $7::numeric[], $8::numeric[], $9::numeric[], $10::boolean[]
+        ) AS u(product_id, label, base_amount, base_unit, gram_weight,
+               calories, protein, carbs, fat, is_default)
+        """,
+        *columns,
+    )
+
+
 # ---------------------------------------------------------------------------
 # OFF Seeder
 # ---------------------------------------------------------------------------
@@ -80,6 +141,14 @@ class OffSeeder(AbstractSeeder):
         total_products = 0
         total_portions = 0
         skipped_dedup = 0
+        # Keyed by product so a barcode repeated in the CSV keeps only its last
+        # portions; a repeat in a later batch deletes and replaces the earlier ones.
+        portion_rows: dict[uuid.UUID, list[tuple[Any, ...]]] = {}
+
+        if not dry_run:
+            # Prepared once up front; both run for every CSV row.
+            usda_name_exists = await conn.prepare(_USDA_NAME_EXISTS_SQL)
+            upsert_product = await conn.prepare(_UPSERT_PRODUCT_SQL)
 
         with open(csv_path, encoding="utf-8", newline="") as f:
             reader = csv.DictReader(f)
@@ -101,15 +170,7 @@ class OffSeeder(AbstractSeeder):
                     continue
 
                 # Dedup check: skip if display_name already exists as USDA
-                existing = await conn.fetchval(
-                    """
-                    SELECT 1 FROM catalog_products
-                    WHERE source = 'usda'
-                      AND lower(trim(display_name)) = lower(trim($1))
-                    LIMIT 1
-                    """,
-                    product_name,
-                )
+                existing = await usda_name_exists.fetchval(product_name)
                 if existing:
                     skipped_dedup += 1
                     continue
@@ -119,88 +180,49 @@ class OffSeeder(AbstractSeeder):
                 fat = _safe_float(row.get("fat_100g"))
 
                 # Upsert product
-                catalog_row = await conn.fetchrow(
-                    """
-                    INSERT INTO catalog_products
-                        (id, source, source_id, name, display_name, brand, barcode,
-                         category, created_at, updated_at)
-                    VALUES
-                        (gen_random_uuid(), 'off', $1, $2, $2, $3, $4,
-                         NULL, now(), now())
-                    ON CONFLICT (source, source_id) DO UPDATE SET
-                        name = EXCLUDED.name,
-                        display_name = EXCLUDED.display_name,
-                        brand = EXCLUDED.brand,
-                        barcode = EXCLUDED.barcode,
-                        updated_at = now()
-                    RETURNING id
-                    """,
+                catalog_row = await upsert_product.fetchrow(
                     barcode, product_name, brand, barcode,
                 )
                 catalog_product_id: uuid.UUID = catalog_row["id"]
 
-                # Replace existing portions
-                await conn.execute(
-                    "DELETE FROM catalog_portions WHERE catalog_product_id = $1",
-                    catalog_product_id,
-                )
-
-                portions_inserted = 0
-
                 # Default "100 g" portion
-                await conn.execute(
-                    """
-                    INSERT INTO catalog_portions
-                        (id, catalog_product_id, label, base_amount, base_unit,
-                         gram_weight, calories, protein, carbs, fat,
-                         is_default, created_at, updated_at)
-                    VALUES
-                        (gen_random_uuid(), $1, '100 g', 100, 'g',
-                         100, $2, $3, $4, $5, true, now(), now())
-                    """,
-                    catalog_product_id,
-                    round(kcal, 3),
-                    round(protein, 3) if protein is not None else None,
-                    round(carbs, 3) if carbs is not None else None,
-                    round(fat, 3) if fat is not None else None,
-                )
-                portions_inserted += 1
+                product_portions = portion_rows[catalog_product_id] = []
+                product_portions.append((
+                    catalog_product_id, "100 g", 100, "g", 100,
+                    *_scaled_macros(kcal, protein, carbs, fat, 1.0),
+                    True,
+                ))
+                portions_inserted = 1
 
                 # Optional serving portion
                 serving_raw = (row.get("serving_size") or "").strip()
                 if serving_raw:
                     label, gram_weight = parse_serving_size(serving_raw)
                     if gram_weight is not None and gram_weight > 0:
-                        scale = gram_weight / 100.0
-                        await conn.execute(
-                            """
-                            INSERT INTO catalog_portions
-                                (id, catalog_product_id, label, base_amount, base_unit,
-                                 gram_weight, calories, protein, carbs, fat,
-                                 is_default, created_at, updated_at)
-                            VALUES
-                                (gen_random_uuid(), $1, $2, 1, 'serving',
-                                 $3, $4, $5, $6, $7, false, now(), now())
-                            """,
-                            catalog_product_id,
-                            label,
+                        product_portions.append((
+                            catalog_product_id, label, 1, "serving",
                             round(gram_weight, 3),
-                            round(kcal * scale, 3),
-                            round(protein * scale, 3) if protein is not None else None,
-                            round(carbs * scale, 3) if carbs is not None else None,
-                            round(fat * scale, 3) if fat is not None else None,
-                        )
+                            *_scaled_macros(kcal, protein, carbs, fat, gram_weight / 100.0),
+                            False,
+                        ))
                         portions_inserted += 1
 
                 total_products += 1
                 total_portions += portions_inserted
 
+                if len(portion_rows) >= _PORTION_BATCH:
+                    await _replace_portions(conn, portion_rows)
+                    portion_rows.clear()
+
                 if total_products > 0 and total_products % 500 == 0:
                     logger.info(
                         "OFF progress: %d products, %d portions seeded...",
                         total_products, total_portions,
                     )
 
+        if portion_rows:
+            await _replace_portions(conn, portion_rows)
+
         if skipped_dedup:
             logger.info("OFF dedup: skipped %d products matching existing USDA names.", skipped_dedup)
 
@@ -210,6 +232,22 @@ class OffSeeder(AbstractSeeder):
         return total_products, total_portions
 
 
+def _scaled_macros(
+    kcal: float,
+    protein: float | None,
+    carbs: float | None,
+    fat: float | None,
+    factor: float,
+) -> tuple[float, float | None, float | None, float | None]:
+    """Scale per-100 g macros by ``factor`` and round to the column precision."""
+    return (
+        round(kcal * factor, 3),
+        None if protein is None else round(protein * factor, 3),
+        None if carbs is None else round(carbs * factor, 3),
+        None if fat is None else round(fat * factor, 3),
+    )
+
+
 def _safe_float(value: str | float | None) -> float | None:
     """Convert a CSV value to float, returning None on failure."""
     if value is None or value == "":
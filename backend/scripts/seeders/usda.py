@@ -6,13 +6,22 @@ into ``catalog_products`` / ``catalog_portions``.
 
 from __future__ import annotations
 
-import glob
-import json
+import fnmatch
+import hashlib
+import itertools
 import logging
+import mmap
 import os
-import uuid
+from collections.abc import Iterator
 from typing import Any
 
+import orjson
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - only needed for --low-memory
+    ijson = None  # type: ignore[assignment]
+
 from scripts.seeders.base import (
     AbstractSeeder,
     build_portion_label,
@@ -33,10 +42,108 @@ _SR_LEGACY_GLOBS: list[str] = [
     "FoodData_Central_sr_legacy_food_json_*.json",
 ]
 
+# Rows buffered before each COPY + merge; bounds memory while keeping batches
+# in the range where Postgres bulk loading stops getting cheaper per row.
+_PRODUCT_BATCH = 10_000
+_PORTION_BATCH = 10_000
+
+# Foods run through the quality gates and row building per call.
+_PARSE_CHUNK = 2_000
+
+# Staging row layouts for COPY (see ``UsdaSeeder._flush``).
+# Products carry the per-100 g macros; portions carry only their gram weight and
+# are scaled in SQL during the merge.
+ProductRow = tuple[
+    str, str, str, str | None, float, float | None, float | None, float | None, bytes,
+]
+PortionRow = tuple[str, str, float, str, float, bool]
+
+_PRODUCT_STG_COLUMNS: list[str] = [
+    "source_id", "name", "display_name", "category",
+    "kcal_100g", "protein_100g", "carbs_100g", "fat_100g", "source_hash",
+]
+_PORTION_STG_COLUMNS: list[str] = [
+    "source_id", "label", "base_amount", "base_unit", "gram_weight", "is_default",
+]
+
+# Mixed into every source_hash. Bump whenever the rows built from a food change
+# (name cleaning, portion rules, ...) so the next seed rewrites every product.
+_ROW_FORMAT_VERSION = b"1"
+
+
+def _source_hash(food: dict[str, Any]) -> bytes:
+    """Return a 16-byte digest identifying a food record and the row format."""
+    h = hashlib.blake2b(_ROW_FORMAT_VERSION, digest_size=16)
+    h.update(orjson.dumps(food, option=orjson.OPT_SORT_KEYS))
+    return h.digest()
+
+
+def _load_json(path: str) -> dict[str, Any]:
+    """Parse a (potentially very large) JSON file with ``orjson``.
+
+    The file is memory-mapped and decoded straight from the mapped UTF-8 bytes.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _iter_foods(path: str, *, stream: bool = False) -> Iterator[dict[str, Any]]:
+    """Yield SR Legacy foods one at a time.
+
+    By default the whole file is decoded with ``_load_json`` (orjson over an
+    mmap), the fastest path. ``stream=True`` parses incrementally with
+    ``ijson`` instead, so peak memory is one food rather than the whole
+    document, at the cost of a slower decode.
+    """
+    if not stream:
+        yield from _load_json(path).get("SRLegacyFoods", [])
+        return
+
+    if ijson is None:
+        raise RuntimeError("Streaming the SR Legacy file (--low-memory) requires ijson.")
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "SRLegacyFoods.item", use_float=True)
+
+
+def _chunked(items: Iterator[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    """Group an iterator into lists of at most ``size`` items."""
+    while chunk := list(itertools.islice(items, size)):
+        yield chunk
+
+
+def _parse_foods(
+    foods: list[dict[str, Any]], with_portions: bool,
+) -> tuple[list[ProductRow], list[PortionRow]]:
+    """Apply the quality gates and build staging rows for a chunk of foods."""
+    product_rows: list[ProductRow] = []
+    portion_rows: list[PortionRow] = []
+    for food in foods:
+        if not UsdaSeeder._is_valid_food(food):
+            continue
+        if not UsdaSeeder._is_not_excluded_category(food):
+            continue
+
+        macros = extract_macros_per_100g(food)
+        kcal = calc_kcal_per_100g(macros)
+
+        if not UsdaSeeder._has_calories(kcal):
+            continue
+
+        product_rows.append(UsdaSeeder._product_row(food, macros, kcal))
+        if with_portions:
+            portion_rows.extend(UsdaSeeder._portion_rows(food))
+    return product_rows, portion_rows
+
 
 class UsdaSeeder(AbstractSeeder):
     """Seed catalog from the USDA SR Legacy JSON."""
 
+    def __init__(self, seeds_dir: str, *, low_memory: bool = False) -> None:
+        super().__init__(seeds_dir)
+        # Stream the JSON with ijson instead of decoding it whole with orjson
+        self.low_memory = low_memory
+
     # ------------------------------------------------------------------
     # Quality gates (public for testability)
     # ------------------------------------------------------------------
@@ -68,11 +175,23 @@ class UsdaSeeder(AbstractSeeder):
     # ------------------------------------------------------------------
 
     def _find_sr_legacy_file(self) -> str | None:
-        """Find the SR Legacy JSON file in seeds_dir."""
+        """Find the SR Legacy JSON file in seeds_dir.
+
+        Lists the directory once and matches the patterns in priority order,
+        rather than globbing (and re-listing) once per pattern.
+        """
+        try:
+            with os.scandir(self.seeds_dir) as it:
+                names = sorted(
+                    e.name for e in it if not e.name.startswith(".") and e.is_file()
+                )
+        except FileNotFoundError:
+            return None
+
         for pattern in _SR_LEGACY_GLOBS:
-            matches = glob.glob(os.path.join(self.seeds_dir, pattern))
-            if matches:
-                return matches[0]
+            for name in names:
+                if fnmatch.fnmatchcase(name, pattern):
+                    return os.path.join(self.seeds_dir, name)
         return None
 
     # ------------------------------------------------------------------
@@ -93,114 +212,79 @@ class UsdaSeeder(AbstractSeeder):
             return 0, 0
 
         logger.info("Loading USDA SR Legacy data from %s ...", json_path)
-        with open(json_path, encoding="utf-8") as f:
-            data = json.load(f)
-
-        foods: list[dict[str, Any]] = data.get("SRLegacyFoods", [])
-        logger.info("Found %d raw USDA foods.", len(foods))
 
         total_products = 0
         total_portions = 0
+        total_unchanged = 0
+        product_rows: list[ProductRow] = []
+        portion_rows: list[PortionRow] = []
 
-        for food in foods:
-            if not self._is_valid_food(food):
-                continue
-            if not self._is_not_excluded_category(food):
-                continue
-
-            macros = extract_macros_per_100g(food)
-            kcal = calc_kcal_per_100g(macros)
-
-            if not self._has_calories(kcal):
-                continue
+        if not dry_run:
+            await self._create_staging(conn)
 
+        for chunk in _chunked(_iter_foods(json_path, stream=self.low_memory), _PARSE_CHUNK):
+            products, portions = _parse_foods(chunk, not dry_run)
             if dry_run:
-                total_products += 1
+                total_products += len(products)
                 continue
 
-            n_products, n_portions = await self._upsert_food(conn, food, macros, kcal)
-            total_products += n_products
-            total_portions += n_portions
-
-            if total_products > 0 and total_products % 500 == 0:
+            product_rows.extend(products)
+            portion_rows.extend(portions)
+            if len(product_rows) >= _PRODUCT_BATCH or len(portion_rows) >= _PORTION_BATCH:
+                total_products += len(product_rows)
+                total_portions += len(portion_rows)
+                total_unchanged += await self._flush(conn, product_rows, portion_rows)
                 logger.info(
                     "USDA progress: %d products, %d portions seeded...",
                     total_products, total_portions,
                 )
 
+        if product_rows:
+            total_products += len(product_rows)
+            total_portions += len(portion_rows)
+            total_unchanged += await self._flush(conn, product_rows, portion_rows)
+
+        if total_unchanged:
+            logger.info("USDA: %d products unchanged since the last seed.", total_unchanged)
         logger.info(
             "USDA seed complete: %d products, %d portions.", total_products, total_portions,
         )
         return total_products, total_portions
 
-    async def _upsert_food(
-        self,
-        conn: Any,
+    # ------------------------------------------------------------------
+    # Row building (pure, no DB)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _product_row(
         food: dict[str, Any],
         macros: dict[str, float | None],
         kcal: float,
-    ) -> tuple[int, int]:
-        """Upsert a single USDA food and its portions. Returns (1, n_portions)."""
+    ) -> ProductRow:
+        """Build the staging row for a USDA food, including its per-100 g macros."""
         fdc_id: int = food.get("fdcId") or food.get("fdc_id") or 0
         name: str = (food.get("description") or "").strip()
         category: str | None = (food.get("foodCategory") or {}).get("description")
         if isinstance(category, int):
             category = None
-
-        display_name = clean_usda_name(name)
-        source_id = str(fdc_id)
-
-        # Upsert product
-        row = await conn.fetchrow(
-            """
-            INSERT INTO catalog_products
-                (id, source, source_id, name, display_name, category, created_at, updated_at)
-            VALUES
-                (gen_random_uuid(), 'usda', $1, $2, $3, $4, now(), now())
-            ON CONFLICT (source, source_id) DO UPDATE SET
-                name = EXCLUDED.name,
-                display_name = EXCLUDED.display_name,
-                category = EXCLUDED.category,
-                updated_at = now()
-            RETURNING id
-            """,
-            source_id, name, display_name, category,
-        )
-        catalog_product_id: uuid.UUID = row["id"]
-
-        # Replace existing portions
-        await conn.execute(
-            "DELETE FROM catalog_portions WHERE catalog_product_id = $1",
-            catalog_product_id,
+        return (
+            str(fdc_id), name, clean_usda_name(name), category,
+            kcal, macros["protein_g_100g"], macros["carbs_g_100g"], macros["fat_g_100g"],
+            _source_hash(food),
         )
 
-        portions_inserted = 0
+    @staticmethod
+    def _portion_rows(food: dict[str, Any]) -> list[PortionRow]:
+        """Build staging rows for the default "100 g" portion plus USDA food portions."""
+        source_id = str(food.get("fdcId") or food.get("fdc_id") or 0)
 
-        # Default "100 g" portion
-        await conn.execute(
-            """
-            INSERT INTO catalog_portions
-                (id, catalog_product_id, label, base_amount, base_unit,
-                 gram_weight, calories, protein, carbs, fat, is_default, created_at, updated_at)
-            VALUES
-                (gen_random_uuid(), $1, '100 g', 100, 'g',
-                 100, $2, $3, $4, $5, true, now(), now())
-            """,
-            catalog_product_id,
-            round(kcal, 3),
-            round(macros["protein_g_100g"], 3) if macros["protein_g_100g"] is not None else None,
-            round(macros["carbs_g_100g"], 3) if macros["carbs_g_100g"] is not None else None,
-            round(macros["fat_g_100g"], 3) if macros["fat_g_100g"] is not None else None,
-        )
-        portions_inserted += 1
+        rows: list[PortionRow] = [(source_id, "100 g", 100.0, "g", 100.0, True)]
 
-        # USDA food portions
         for portion in food.get("foodPortions", []):
             gram_weight_raw = portion.get("gramWeight")
             if gram_weight_raw is None:
                 continue
 
-            gram_weight = float(gram_weight_raw)
             measure_unit: dict[str, Any] = portion.get("measureUnit") or {}
             unit = normalize_unit(measure_unit.get("abbreviation"), measure_unit.get("name"))
 
@@ -210,29 +294,121 @@ class UsdaSeeder(AbstractSeeder):
             label = build_portion_label(portion)
             amount_raw = portion.get("value") or portion.get("amount") or 1.0
 
-            await conn.execute(
-                """
-                INSERT INTO catalog_portions
-                    (id, catalog_product_id, label, base_amount, base_unit,
-                     gram_weight, calories, protein, carbs, fat, is_default,
-                     created_at, updated_at)
-                VALUES
-                    (gen_random_uuid(), $1, $2, $3, $4,
-                     $5, $6, $7, $8, $9, false, now(), now())
-                """,
-                catalog_product_id,
-                label,
-                round(float(amount_raw), 3),
-                unit,
-                round(gram_weight, 3),
-                round(kcal * gram_weight / 100.0, 3),
-                round(macros["protein_g_100g"] * gram_weight / 100.0, 3)
-                if macros["protein_g_100g"] is not None else None,
-                round(macros["carbs_g_100g"] * gram_weight / 100.0, 3)
-                if macros["carbs_g_100g"] is not None else None,
-                round(macros["fat_g_100g"] * gram_weight / 100.0, 3)
-                if macros["fat_g_100g"] is not None else None,
+            rows.append(
+                (source_id, label, float(amount_raw), unit, float(gram_weight_raw), False),
             )
-            portions_inserted += 1
 
-        return 1, portions_inserted
+        return rows
+
+    # ------------------------------------------------------------------
+    # DB write (COPY into staging, then set-based merge)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    async def _create_staging(conn: Any) -> None:
+        """Create the temp staging tables, dropped when the seed transaction commits."""
+        await conn.execute(
+            """
+            CREATE TEMP TABLE usda_products_stg (
+                source_id text, name text, display_name text, category text,
+                kcal_100g float8, protein_100g float8, carbs_100g float8, fat_100g float8,
+                source_hash bytea
+            ) ON COMMIT DROP;
+            CREATE TEMP TABLE usda_portions_stg (
+                source_id text, label text, base_amount float8, base_unit text,
+                gram_weight float8, is_default boolean
+            ) ON COMMIT DROP;
+            """
+        )
+
+    @staticmethod
+    async def _flush(
+        conn: Any,
+        product_rows: list[ProductRow],
+        portion_rows: list[PortionRow],
+    ) -> int:
+        """COPY one batch into the staging tables, merge it, then clear staging and buffers.
+
+        Replaces one INSERT per product plus one per portion with a binary COPY
+        and an ``INSERT ... SELECT ... ON CONFLICT`` merge, so the number of
+        round-trips scales with the number of batches rather than rows. Portion
+        macros are scaled from the product's per-100 g values inside the merge,
+        which keeps the per-portion arithmetic out of Python.
+
+        Products whose stored ``source_hash`` matches the staged one are dropped
+        from staging first, so unchanged foods cost no writes at all.
+
+        Returns:
+            The number of staged products skipped as unchanged.
+        """
+        await conn.copy_records_to_table(
+            "usda_products_stg", records=product_rows, columns=_PRODUCT_STG_COLUMNS,
+        )
+        await conn.copy_records_to_table(
+            "usda_portions_stg", records=portion_rows, columns=_PORTION_STG_COLUMNS,
+        )
+
+        status = await conn.execute(
+            """
+            DELETE FROM usda_products_stg s
+            USING catalog_products p
+            WHERE p.source = 'usda'
+              AND p.source_id = s.source_id
+              AND p.source_hash = s.source_hash
+            """
+        )
+        unchanged = int(status.rsplit(" ", 1)[1])
+
+        await conn.execute(
+            """
+            INSERT INTO catalog_products
+                (id, source, source_id, name, display_name, category, source_hash,
+                 created_at, updated_at)
+            SELECT DISTINCT ON (source_id)
+                gen_random_uuid(), 'usda', source_id, name, display_name, category, source_hash,
+                now(), now()
+            FROM usda_products_stg
+            ORDER BY source_id
+            ON CONFLICT (source, source_id) DO UPDATE SET
+                name = EXCLUDED.name,
+                display_name = EXCLUDED.display_name,
+                category = EXCLUDED.category,
+                source_hash = EXCLUDED.source_hash,
+                updated_at = now()
+            """
+        )
+
+        # Replace existing portions of every staged product
+        await conn.execute(
+            """
+            DELETE FROM catalog_portions cp
+            USING catalog_products p, usda_products_stg s
+            WHERE cp.catalog_product_id = p.id
+              AND p.source = 'usda'
+              AND p.source_id = s.source_id
+            """
+        )
+        await conn.execute(
+            """
+            INSERT INTO catalog_portions
+                (id, catalog_product_id, label, base_amount, base_unit,
+                 gram_weight, calories, protein, carbs, fat, is_default,
+                 created_at, updated_at)
+            SELECT
+                gen_random_uuid(), p.id, s.label, s.base_amount, s.base_unit::unit_enum,
+                s.gram_weight,
+                round((m.kcal_100g * s.gram_weight / 100)::numeric, 3),
+                round((m.protein_100g * s.gram_weight / 100)::numeric, 3),
+                round((m.carbs_100g * s.gram_weight / 100)::numeric, 3),
+                round((m.fat_100g * s.gram_weight / 100)::numeric, 3),
+                s.is_default, now(), now()
+            FROM usda_portions_stg s
+            JOIN usda_products_stg m ON m.source_id = s.source_id
+            JOIN catalog_products p ON p.source = 'usda' AND p.source_id = s.source_id
+            """
+        )
+
+        await conn.execute("TRUNCATE usda_products_stg, usda_portions_stg")
+        product_rows.clear()
+        portion_rows.clear()
+        return unchanged
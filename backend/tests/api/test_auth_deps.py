@@ -5,9 +5,12 @@ from __future__ import annotations
 import uuid
 
 import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.deps import get_current_device
 from app.features.auth.models import Device
 from app.features.auth.service import issue_device_token
 
@@ -24,6 +27,25 @@ async def test_no_auth_header_returns_401(authenticated_client: tuple[AsyncClien
     assert "bearer token" in response.json()["detail"].lower()
 
 
+@pytest.mark.parametrize(
+    "credentials",
+    [
+        None,
+        HTTPAuthorizationCredentials(scheme="Basic", credentials="sometoken"),
+        HTTPAuthorizationCredentials(scheme="Bearer", credentials="not-a-valid-token"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_get_current_device_rejects_without_db(
+    credentials: HTTPAuthorizationCredentials | None,
+):
+    """Test the dependency raises 401 before touching the session."""
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_device(credentials=credentials, session=None)
+
+    assert exc_info.value.status_code == 401
+
+
 @pytest.mark.asyncio
 async def test_invalid_scheme_returns_401(app_client: AsyncClient):
     """Test that non-Bearer scheme returns 401."""
@@ -2,18 +2,33 @@
 
 from __future__ import annotations
 
+import itertools
 import uuid
 
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from tests.factories import create_catalog_portion, create_catalog_product
+from tests.factories import (
+    build_catalog_product,
+    create_catalog_portion,
+    create_catalog_product,
+)
+
+# A per-run prefix keeps markers clear of rows left by earlier runs; the counter
+# makes them unique within the run without drawing a uuid4 per call.
+_RUN_PREFIX = uuid.uuid4().hex[:4]
+_MARKER_COUNTER = itertools.count()
+
+
+def _unique_marker() -> str:
+    """Return an 8-hex-char marker unique to this test run."""
+    return f"{_RUN_PREFIX}{next(_MARKER_COUNTER):04x}"
 
 
 def _unique_name(prefix: str) -> str:
     """Return a unique product name for test isolation."""
-    return f"{prefix}-{uuid.uuid4().hex[:8]}"
+    return f"{prefix}-{_unique_marker()}"
 
 
 @pytest.mark.asyncio
@@ -29,12 +44,11 @@ async def test_list_catalog_products_returns_list(
     db_session: AsyncSession,
 ) -> None:
     """Authenticated device gets a list of catalog products."""
-    marker = uuid.uuid4().hex[:8]
+    marker = _unique_marker()
     name_a = f"WholeWheatBread-{marker}"
     name_b = f"CheddarCheese-{marker}"
     prod_a = await create_catalog_product(db_session, name=name_a, display_name=name_a)
     prod_b = await create_catalog_product(db_session, name=name_b, display_name=name_b)
-    await db_session.commit()
 
     client, _ = authenticated_client
     # Use the unique marker to filter so results are deterministic
@@ -53,14 +67,13 @@ async def test_list_catalog_products_search(
     db_session: AsyncSession,
 ) -> None:
     """?search= filters results by display_name."""
-    marker = uuid.uuid4().hex[:8]
+    marker = _unique_marker()
     name_greek = f"GreekYogurt-{marker}"
     name_plain = f"PlainYogurt-{marker}"
     name_cheese = f"CheddarCheese-{marker}"
     p_greek = await create_catalog_product(db_session, name=name_greek, display_name=name_greek)
     p_plain = await create_catalog_product(db_session, name=name_plain, display_name=name_plain)
     await create_catalog_product(db_session, name=name_cheese, display_name=name_cheese)
-    await db_session.commit()
 
     client, _ = authenticated_client
     response = await client.get(f"/v1/catalog/products?search=Yogurt-{marker}")
@@ -79,14 +92,11 @@ async def test_list_catalog_products_pagination(
     db_session: AsyncSession,
 ) -> None:
     """limit and offset query params work."""
-    marker = uuid.uuid4().hex[:8]
-    for i in range(5):
-        await create_catalog_product(
-            db_session,
-            name=f"PaginatedAPIItem-{marker}-{i:02d}",
-            display_name=f"PaginatedAPIItem-{marker}-{i:02d}",
-        )
-    await db_session.commit()
+    marker = _unique_marker()
+    db_session.add_all(
+        build_catalog_product(name=f"PaginatedAPIItem-{marker}-{i:02d}") for i in range(5)
+    )
+    await db_session.flush()
 
     client, _ = authenticated_client
     page1 = await client.get(
@@ -105,6 +115,27 @@ async def test_list_catalog_products_pagination(
     assert ids1.isdisjoint(ids2)
 
 
+@pytest.mark.asyncio
+async def test_list_catalog_products_after_cursor(
+    authenticated_client: tuple[AsyncClient, uuid.UUID],
+    db_session: AsyncSession,
+) -> None:
+    """after=<last id> returns the next page; with a ranked search it is a 400."""
+    marker = _unique_marker()
+    db_session.add_all(build_catalog_product(name=f"CursorAPIItem-{marker}-{i:02d}") for i in range(3))
+    await db_session.flush()
+
+    client, _ = authenticated_client
+    page1 = await client.get("/v1/catalog/products?limit=2")
+    last_id = page1.json()[-1]["id"]
+    page2 = await client.get(f"/v1/catalog/products?limit=2&after={last_id}")
+    ranked = await client.get(f"/v1/catalog/products?search=CursorAPIItem&after={last_id}")
+
+    assert page2.status_code == 200
+    assert [item["display_name"] for item in page2.json()] == [f"CursorAPIItem-{marker}-02"]
+    assert ranked.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_get_catalog_product_returns_product_with_portions(
     authenticated_client: tuple[AsyncClient, uuid.UUID],
@@ -128,7 +159,6 @@ async def test_get_catalog_product_returns_product_with_portions(
         calories=416,
         is_default=False,
     )
-    await db_session.commit()
 
     client, _ = authenticated_client
     response = await client.get(f"/v1/catalog/products/{product.id}")
@@ -162,7 +192,7 @@ async def test_list_catalog_products_default_portion_included(
     db_session: AsyncSession,
 ) -> None:
     """List endpoint includes the default_portion field."""
-    marker = uuid.uuid4().hex[:8]
+    marker = _unique_marker()
     name = f"Avocado-{marker}"
     product = await create_catalog_product(db_session, name=name, display_name=name)
     await create_catalog_portion(
@@ -172,7 +202,6 @@ async def test_list_catalog_products_default_portion_included(
         calories=160,
         is_default=True,
     )
-    await db_session.commit()
 
     client, _ = authenticated_client
     response = await client.get(f"/v1/catalog/products?search=Avocado-{marker}")
@@ -192,7 +221,7 @@ async def test_list_catalog_products_response_includes_new_fields(
     db_session: AsyncSession,
 ) -> None:
     """Response includes source, source_id, display_name, brand, barcode."""
-    marker = uuid.uuid4().hex[:8]
+    marker = _unique_marker()
     product = await create_catalog_product(
         db_session,
         name=f"TestProduct-{marker}",
@@ -202,7 +231,6 @@ async def test_list_catalog_products_response_includes_new_fields(
         brand=f"TestBrand-{marker}",
         barcode=f"1234567890{marker}",
     )
-    await db_session.commit()
 
     client, _ = authenticated_client
     response = await client.get(f"/v1/catalog/products?search=TestProduct-{marker}")
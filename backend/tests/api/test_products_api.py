@@ -5,8 +5,17 @@ from __future__ import annotations
 import uuid
 
 import pytest
+from fastapi import FastAPI
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
 from httpx import AsyncClient
 
+from app.core.deps import get_current_device
+from tests.factories import new_id
+
+# Bound str.format of the route templates used throughout this module
+_PRODUCT_URL = "/v1/products/{}".format
+
 
 @pytest.mark.asyncio
 async def test_list_products_empty(authenticated_client: tuple[AsyncClient, uuid.UUID]):
@@ -24,10 +33,10 @@ async def test_list_products_with_data(authenticated_client: tuple[AsyncClient,
     client, _ = authenticated_client
 
     # Create two products
-    product1_id = str(uuid.uuid4())
+    product1_id = new_id()
     await client.post("/v1/products", json={"id": product1_id, "name": "Apple"})
 
-    product2_id = str(uuid.uuid4())
+    product2_id = new_id()
     await client.post("/v1/products", json={"id": product2_id, "name": "Banana"})
 
     # List products
@@ -43,7 +52,7 @@ async def test_create_product(authenticated_client: tuple[AsyncClient, uuid.UUID
     """Test creating a product returns 201 and product data."""
     client, _ = authenticated_client
 
-    product_id = str(uuid.uuid4())
+    product_id = new_id()
     response = await client.post("/v1/products", json={"id": product_id, "name": "Orange"})
 
     assert response.status_code == 201
@@ -59,7 +68,7 @@ async def test_create_product_validation_error(authenticated_client: tuple[Async
     """Test creating product with invalid data returns 422."""
     client, _ = authenticated_client
 
-    response = await client.post("/v1/products", json={"id": str(uuid.uuid4())})
+    response = await client.post("/v1/products", json={"id": new_id()})
     assert response.status_code == 422  # Missing name
 
 
@@ -69,65 +78,45 @@ async def test_get_product_found(authenticated_client: tuple[AsyncClient, uuid.U
     client, _ = authenticated_client
 
     # Create product
-    product_id = str(uuid.uuid4())
+    product_id = new_id()
     await client.post("/v1/products", json={"id": product_id, "name": "Grape"})
 
     # Get product
-    response = await client.get(f"/v1/products/{product_id}")
+    response = await client.get(_PRODUCT_URL(product_id))
     assert response.status_code == 200
     data = response.json()
     assert data["id"] == product_id
     assert data["name"] == "Grape"
 
 
-@pytest.mark.asyncio
-async def test_get_product_not_found(authenticated_client: tuple[AsyncClient, uuid.UUID]):
-    """Test getting non-existent product returns 404."""
-    client, _ = authenticated_client
-
-    unknown_id = str(uuid.uuid4())
-    response = await client.get(f"/v1/products/{unknown_id}")
-    assert response.status_code == 404
-
-
 @pytest.mark.asyncio
 async def test_update_product(authenticated_client: tuple[AsyncClient, uuid.UUID]):
     """Test updating a product returns 200 with updated data."""
     client, _ = authenticated_client
 
     # Create product
-    product_id = str(uuid.uuid4())
+    product_id = new_id()
     await client.post("/v1/products", json={"id": product_id, "name": "Peach"})
 
     # Update product
-    response = await client.patch(f"/v1/products/{product_id}", json={"name": "Nectarine"})
+    response = await client.patch(_PRODUCT_URL(product_id), json={"name": "Nectarine"})
     assert response.status_code == 200
     data = response.json()
     assert data["id"] == product_id
     assert data["name"] == "Nectarine"
 
 
-@pytest.mark.asyncio
-async def test_update_product_not_found(authenticated_client: tuple[AsyncClient, uuid.UUID]):
-    """Test updating non-existent product returns 404."""
-    client, _ = authenticated_client
-
-    unknown_id = str(uuid.uuid4())
-    response = await client.patch(f"/v1/products/{unknown_id}", json={"name": "Test"})
-    assert response.status_code == 404
-
-
 @pytest.mark.asyncio
 async def test_delete_product(authenticated_client: tuple[AsyncClient, uuid.UUID]):
     """Test deleting a product returns 204 and soft-deletes."""
     client, _ = authenticated_client
 
     # Create product
-    product_id = str(uuid.uuid4())
+    product_id = new_id()
     await client.post("/v1/products", json={"id": product_id, "name": "Mango"})
 
     # Delete product
-    response = await client.delete(f"/v1/products/{product_id}")
+    response = await client.delete(_PRODUCT_URL(product_id))
     assert response.status_code == 204
 
     # Product should not appear in list
@@ -136,14 +125,28 @@ async def test_delete_product(authenticated_client: tuple[AsyncClient, uuid.UUID
     assert not any(p["id"] == product_id for p in products)
 
 
+# (method, path template, JSON body) for requests that must 404 on an unknown id
+_NOT_FOUND_CASES: tuple[tuple[str, str, dict | None], ...] = (
+    ("GET", "/v1/products/{id}", None),
+    ("PATCH", "/v1/products/{id}", {"name": "Test"}),
+    ("DELETE", "/v1/products/{id}", None),
+    ("GET", "/v1/portions/{id}", None),
+    (
+        "POST",
+        "/v1/products/{id}/portions",
+        {"label": "Test", "base_amount": 100, "base_unit": "g", "calories": 100, "is_default": False},
+    ),
+)
+
+
 @pytest.mark.asyncio
-async def test_delete_product_not_found(authenticated_client: tuple[AsyncClient, uuid.UUID]):
-    """Test deleting non-existent product returns 404."""
+async def test_unknown_ids_return_404(authenticated_client: tuple[AsyncClient, uuid.UUID]):
+    """Test product and portion endpoints return 404 for ids that do not exist."""
     client, _ = authenticated_client
 
-    unknown_id = str(uuid.uuid4())
-    response = await client.delete(f"/v1/products/{unknown_id}")
-    assert response.status_code == 404
+    for method, path, body in _NOT_FOUND_CASES:
+        response = await client.request(method, path.format(id=uuid.uuid4()), json=body)
+        assert response.status_code == 404, (method, path)
 
 
 @pytest.mark.asyncio
@@ -153,56 +156,47 @@ async def test_device_scoping_prevents_cross_device_access(
 ):
     """Test that device A cannot access device B's products."""
     # Register device A
-    device_a_id = str(uuid.uuid4())
+    device_a_id = new_id()
     response_a = await app_client.post("/v1/devices/register", json={"device_id": device_a_id})
     token_a = response_a.json()["device_token"]
 
     # Register device B
-    device_b_id = str(uuid.uuid4())
+    device_b_id = new_id()
     response_b = await app_client.post("/v1/devices/register", json={"device_id": device_b_id})
     token_b = response_b.json()["device_token"]
 
     # Device A creates a product
     app_client.headers["Authorization"] = f"Bearer {token_a}"
-    product_id = str(uuid.uuid4())
+    product_id = new_id()
     await app_client.post("/v1/products", json={"id": product_id, "name": "Device A Product"})
 
     # Device B tries to access Device A's product
     app_client.headers["Authorization"] = f"Bearer {token_b}"
-    response = await app_client.get(f"/v1/products/{product_id}")
+    response = await app_client.get(_PRODUCT_URL(product_id))
     assert response.status_code == 404
 
 
+def _depends_on(dependant: Dependant, call: object) -> bool:
+    return any(
+        dep.call is call or _depends_on(dep, call) for dep in dependant.dependencies
+    )
+
+
 @pytest.mark.asyncio
-async def test_requires_authentication(app_client: AsyncClient):
+async def test_requires_authentication(app: FastAPI, app_client: AsyncClient):
     """Test that all product endpoints require authentication."""
-    # List
+    # One request through the full stack; the 401 paths themselves are
+    # covered in test_auth_deps.py.
     response = await app_client.get("/v1/products")
     assert response.status_code == 401
 
-    # Get
-    response = await app_client.get(f"/v1/products/{uuid.uuid4()}")
-    assert response.status_code == 401
-
-    # Create
-    response = await app_client.post("/v1/products", json={"id": str(uuid.uuid4()), "name": "Test"})
-    assert response.status_code == 401
-
-    # Update
-    response = await app_client.patch(f"/v1/products/{uuid.uuid4()}", json={"name": "Test"})
-    assert response.status_code == 401
-
-    # Delete
-    response = await app_client.delete(f"/v1/products/{uuid.uuid4()}")
-    assert response.status_code == 401
-
-    # Search
-    response = await app_client.get("/v1/products/search?q=test")
-    assert response.status_code == 401
-
-    # Check name
-    response = await app_client.get("/v1/products/check-name?name=test")
-    assert response.status_code == 401
+    product_routes = [
+        route for route in app.routes
+        if isinstance(route, APIRoute) and route.path.startswith("/v1/products")
+    ]
+    assert product_routes
+    for route in product_routes:
+        assert _depends_on(route.dependant, get_current_device), route.path
 
 
 @pytest.mark.asyncio
@@ -210,7 +204,7 @@ async def test_search_returns_results(authenticated_client: tuple[AsyncClient, u
     """GET /v1/products/search?q=... returns a list."""
     client, _ = authenticated_client
     marker = uuid.uuid4().hex[:8]
-    product_id = str(uuid.uuid4())
+    product_id = new_id()
     await client.post("/v1/products", json={"id": product_id, "name": f"SearchItem{marker}"})
 
     response = await client.get(f"/v1/products/search?q=SearchItem{marker}")
@@ -226,7 +220,7 @@ async def test_search_source_tags(authenticated_client: tuple[AsyncClient, uuid.
     """User items have source='user'; catalog items have source='catalog'."""
     client, _ = authenticated_client
     marker = uuid.uuid4().hex[:8]
-    product_id = str(uuid.uuid4())
+    product_id = new_id()
     await client.post("/v1/products", json={"id": product_id, "name": f"SourceTag{marker}"})
 
     response = await client.get(f"/v1/products/search?q=SourceTag{marker}")
@@ -243,7 +237,7 @@ async def test_search_result_includes_macro_keys(authenticated_client: tuple[Asy
     """Search results always include protein_per_100g, carbs_per_100g, fat_per_100g keys."""
     client, _ = authenticated_client
     marker = uuid.uuid4().hex[:8]
-    product_id = str(uuid.uuid4())
+    product_id = new_id()
     await client.post("/v1/products", json={"id": product_id, "name": f"MacroKey{marker}"})
 
     response = await client.get(f"/v1/products/search?q=MacroKey{marker}")
@@ -289,7 +283,7 @@ async def test_check_name_taken(authenticated_client: tuple[AsyncClient, uuid.UU
     """Existing name → {"available": false}."""
     client, _ = authenticated_client
 
-    await client.post("/v1/products", json={"id": str(uuid.uuid4()), "name": "TakenProduct"})
+    await client.post("/v1/products", json={"id": new_id(), "name": "TakenProduct"})
 
     response = await client.get("/v1/products/check-name", params={"name": "TakenProduct"})
 
@@ -302,7 +296,7 @@ async def test_check_name_case_insensitive(authenticated_client: tuple[AsyncClie
     """'chicken' when 'Chicken' exists → {"available": false}."""
     client, _ = authenticated_client
 
-    await client.post("/v1/products", json={"id": str(uuid.uuid4()), "name": "Chicken"})
+    await client.post("/v1/products", json={"id": new_id(), "name": "Chicken"})
 
     response = await client.get("/v1/products/check-name", params={"name": "chicken"})
 
@@ -1,8 +1,7 @@
 """Unit tests for app.api.rate_limit — in-memory rate limiter."""
 from __future__ import annotations
 
-import time
-from unittest.mock import MagicMock
+from dataclasses import dataclass, field
 
 import pytest
 from fastapi import HTTPException
@@ -10,13 +9,22 @@ from fastapi import HTTPException
 from app.core.rate_limit import RateLimiter
 
 
-def _make_request(ip: str = "127.0.0.1") -> MagicMock:
-    """Create a mock Request object with a given client IP."""
-    request = MagicMock()
-    request.client = MagicMock()
-    request.client.host = ip
-    request.headers = {}
-    return request
+@dataclass(slots=True, frozen=True)
+class FakeClient:
+    host: str
+
+
+@dataclass(slots=True, frozen=True)
+class FakeRequest:
+    """The two Request attributes RateLimiter reads."""
+
+    client: FakeClient | None
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def _make_request(ip: str = "127.0.0.1") -> FakeRequest:
+    """Create a fake Request object with a given client IP."""
+    return FakeRequest(FakeClient(ip))
 
 
 class TestRateLimiter:
@@ -61,8 +69,9 @@ class TestRateLimiter:
     async def test_uses_x_forwarded_for_header(self) -> None:
         limiter = RateLimiter(max_requests=1, window_seconds=60)
 
-        request = _make_request("10.0.0.1")
-        request.headers = {"x-forwarded-for": "203.0.113.5, 10.0.0.1"}
+        request = FakeRequest(
+            FakeClient("10.0.0.1"), {"x-forwarded-for": "203.0.113.5, 10.0.0.1"},
+        )
 
         await limiter(request)
 
@@ -71,22 +80,18 @@ class TestRateLimiter:
 
     @pytest.mark.asyncio
     async def test_window_expiry_allows_new_requests(self) -> None:
-        limiter = RateLimiter(max_requests=1, window_seconds=1)
+        # First call at t=0, second after the 1 s window has passed
+        limiter = RateLimiter(max_requests=1, window_seconds=1, clock=iter([0.0, 1.1]).__next__)
         request = _make_request()
 
         await limiter(request)
 
-        # Wait for window to expire
-        time.sleep(1.1)
-
         # Should be allowed again
         await limiter(request)
 
     @pytest.mark.asyncio
     async def test_handles_missing_client(self) -> None:
         limiter = RateLimiter(max_requests=5, window_seconds=60)
-        request = MagicMock()
-        request.client = None
-        request.headers = {}
+        request = FakeRequest(client=None)
 
         await limiter(request)  # Should not raise
@@ -2,24 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import itertools
 import os
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 
+import pytest
 import pytest_asyncio
+from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import text
+from pytest_asyncio import is_async_test
+from sqlalchemy import URL, event, make_url, text
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
-    async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from app.core.db import Base, get_session
 from app.features.auth.models import Device
 from app.features.auth.service import issue_device_token
 from app.features.catalog.models import CatalogPortion, CatalogProduct
+from app.features.catalog.service import clear_catalog_cache
 from app.features.goals.models import UserGoal
 from app.features.meals.models import FoodEntry
 from app.features.portions.models import ProductPortion
@@ -27,6 +36,11 @@ from app.features.products.models import Product
 from app.features.weights.models import BodyWeight
 from app.main import create_app
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is not available on Windows
+    uvloop = None  # type: ignore[assignment]
+
 # Ensure test environment variables are set
 TEST_DATABASE_URL = os.getenv(
     "TEST_DATABASE_URL",
@@ -34,43 +48,146 @@ TEST_DATABASE_URL = os.getenv(
 )
 os.environ.setdefault("DEVICE_TOKEN_PEPPER", "test-pepper-for-unit-tests-only")
 
+_TOKEN_POOL_SIZE = 16
+# Requesting any of these makes a test an integration test
+_DB_FIXTURES = frozenset({"test_database_url", "test_engine", "db_session"})
+# pg_advisory_lock key serialising template builds across xdist workers
+_TEMPLATE_LOCK_KEY = 0x636F756E74
+_SAVEPOINT_SQL = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+# Enum types the models reference but create_all does not own
+_ENUM_DDL: tuple[str, ...] = (
+    """
+    DO $$ BEGIN
+        CREATE TYPE unit_enum AS ENUM ('mg', 'g', 'kg', 'ml', 'l', 'tsp', 'tbsp', 'cup', 'pcs', 'serving');
+    EXCEPTION
+        WHEN duplicate_object THEN null;
+    END $$;
+    """,
+    """
+    DO $$ BEGIN
+        CREATE TYPE meal_type_enum AS ENUM (
+            'breakfast', 'lunch', 'dinner', 'snacks', 'water'
+        );
+    EXCEPTION
+        WHEN duplicate_object THEN null;
+    END $$;
+    """,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_service_caches() -> None:
+    """Start every test with empty service-layer caches.
+
+    The catalog detail cache is process-global, and rows it remembers are
+    rolled back after each test, so a warm entry would leak into the next one.
+    """
+    clear_catalog_cache()
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the session loop on uvloop when it is installed."""
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
-@pytest_asyncio.fixture
-async def test_engine() -> AsyncIterator[AsyncEngine]:
-    """Create test engine for each test."""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False, pool_pre_ping=True)
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run async tests on the session event loop and tag tests by tier.
+
+    Anything that pulls in a database fixture is marked ``integration``, the
+    rest ``unit``, so ``pytest -m "not integration"`` runs without Postgres.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        if _DB_FIXTURES.intersection(getattr(item, "fixturenames", ())):
+            item.add_marker(pytest.mark.integration)
+        else:
+            item.add_marker(pytest.mark.unit)
+
+
+def _schema_fingerprint() -> str:
+    """Hash of the enum DDL plus the CREATE TABLE/INDEX statements for every model."""
+    dialect = postgresql.dialect()
+    digest = hashlib.sha256()
+    for ddl in _ENUM_DDL:
+        digest.update(ddl.encode())
+    for table in Base.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda ix: ix.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    return digest.hexdigest()
+
+
+async def _build_schema(url: URL) -> None:
+    engine = create_async_engine(url, poolclass=NullPool)
 
     # Import all models to ensure they're registered with Base
     _ = (Device, Product, ProductPortion, FoodEntry, UserGoal, BodyWeight, CatalogProduct, CatalogPortion)
 
-    # Create schema (reuse existing enums if they exist)
     async with engine.begin() as conn:
-        # Create enums if they don't exist
-        await conn.execute(
-            text("""
-            DO $$ BEGIN
-                CREATE TYPE unit_enum AS ENUM ('mg', 'g', 'kg', 'ml', 'l', 'tsp', 'tbsp', 'cup', 'pcs', 'serving');
-            EXCEPTION
-                WHEN duplicate_object THEN null;
-            END $$;
-            """)
-        )
-        await conn.execute(
-            text("""
-            DO $$ BEGIN
-                CREATE TYPE meal_type_enum AS ENUM (
-                    'breakfast', 'lunch', 'dinner', 'snacks', 'water'
-                );
-            EXCEPTION
-                WHEN duplicate_object THEN null;
-            END $$;
-            """)
-        )
-        # Create tables (will fail if exist, but that's ok for now)
+        for ddl in _ENUM_DDL:
+            await conn.execute(text(ddl))
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_database_url() -> AsyncIterator[str]:
+    """Build the schema once into a template database and clone it for this session.
+
+    TEST_DATABASE_URL is only used as the admin connection; the session runs
+    against a throwaway ``<db>_<worker>_<hex>`` copy of ``<db>_template``, so
+    every run starts from an empty schema and DDL is paid once, not per test.
+    The template is tagged with a fingerprint of the schema DDL and only rebuilt
+    when that changes, so most runs skip DDL entirely. Under pytest-xdist each
+    worker gets its own clone and workers serialise on an advisory lock, so at
+    most one of them rebuilds the template.
+    """
+    base = make_url(TEST_DATABASE_URL)
+    template = f"{base.database}_template"
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    clone = f"{base.database}_{worker}_{uuid.uuid4().hex[:8]}"
+    fingerprint = _schema_fingerprint()
+
+    admin = create_async_engine(base, isolation_level="AUTOCOMMIT", poolclass=NullPool)
+    async with admin.connect() as conn:
+        await conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _TEMPLATE_LOCK_KEY})
         try:
-            await conn.run_sync(Base.metadata.create_all)
-        except Exception:  # noqa: S110
-            pass  # Tables already exist - expected in test environment
+            built_for = await conn.scalar(
+                text(
+                    "SELECT shobj_description(oid, 'pg_database') "
+                    "FROM pg_database WHERE datname = :name"
+                ),
+                {"name": template},
+            )
+            if built_for != fingerprint:
+                await conn.execute(text(f'DROP DATABASE IF EXISTS "{template}"'))
+                await conn.execute(text(f'CREATE DATABASE "{template}"'))
+                await _build_schema(base.set(database=template))
+                await conn.execute(text(f"COMMENT ON DATABASE \"{template}\" IS '{fingerprint}'"))
+            await conn.execute(text(f'CREATE DATABASE "{clone}" TEMPLATE "{template}"'))
+        finally:
+            await conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": _TEMPLATE_LOCK_KEY},
+            )
+
+    yield base.set(database=clone).render_as_string(hide_password=False)
+
+    async with admin.connect() as conn:
+        await conn.execute(text(f'DROP DATABASE IF EXISTS "{clone}" WITH (FORCE)'))
+    await admin.dispose()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_engine(test_database_url: str) -> AsyncIterator[AsyncEngine]:
+    """One engine (and connection pool) for the whole test session."""
+    engine = create_async_engine(test_database_url, echo=False)
 
     yield engine
 
@@ -81,42 +198,102 @@ async def test_engine() -> AsyncIterator[AsyncEngine]:
 async def db_session(test_engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
     """Create a test session with savepoint-based isolation.
 
-    Services call session.commit() directly, which commits to the test DB.
-    After each test, we truncate all tables to clean up.
+    The session is bound to a connection holding an outer transaction and joins
+    it with ``create_savepoint``: the commit()/rollback() calls services make
+    release or roll back a SAVEPOINT instead of the real transaction, which is
+    rolled back after the test. Nothing a test writes outlives it.
     """
-    session_local = async_sessionmaker(
-        bind=test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-        autocommit=False,
-    )
+    async with test_engine.connect() as conn:
+        outer = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await outer.rollback()
+
+
+@pytest.fixture
+def sql_statements(db_session: AsyncSession) -> Iterator[list[str]]:
+    """SQL text of every statement ``db_session`` sends, in order.
+
+    Lets a test put a budget on its round trips (``len(sql_statements) <= n``)
+    so an N+1 or an extra lazy load fails here instead of in production.
+    Call ``clear()`` after the arrange step to count only the code under test.
+    SAVEPOINT bookkeeping from the isolation fixture is left out.
+    """
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if not statement.startswith(_SAVEPOINT_SQL):
+            statements.append(statement)
 
-    async with session_local() as session:
-        yield session
-        # Note: Tables persist between tests for performance
-        # Run manual cleanup between test sessions if needed
+    sync_conn = db_session.bind.sync_connection
+    event.listen(sync_conn, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(sync_conn, "before_cursor_execute", record)
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """Build the FastAPI app once; per-test state lives in dependency_overrides."""
+    return create_app()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client(app: FastAPI) -> AsyncIterator[AsyncClient]:
+    """One ASGI transport + client for the session; app_client resets it per test."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
 
 
 @pytest_asyncio.fixture
-async def app_client(db_session: AsyncSession) -> AsyncIterator[AsyncClient]:
+async def app_client(
+    app: FastAPI, http_client: AsyncClient, db_session: AsyncSession,
+) -> AsyncIterator[AsyncClient]:
     """Create test HTTP client with test database session."""
-    app = create_app()
 
     # Override get_session dependency
     async def override_get_session():
         yield db_session
 
     app.dependency_overrides[get_session] = override_get_session
+    default_headers = http_client.headers.copy()
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        yield client
+    try:
+        yield http_client
+    finally:
+        app.dependency_overrides.clear()
+        http_client.headers = default_headers
+        http_client.cookies.clear()
+
+
+@pytest.fixture(scope="session")
+def device_tokens() -> Iterator[tuple[uuid.UUID, str, str]]:
+    """Endless supply of ``(device_id, token, token_hash)`` issued once per session.
+
+    Each test rolls back its Device row, so the same identities can be handed
+    out again; the pool only bounds how many tokens the session ever issues.
+    """
+    pool = []
+    for _ in range(_TOKEN_POOL_SIZE):
+        device_id = uuid.uuid4()
+        pool.append((device_id, *issue_device_token(device_id)))
+    return itertools.cycle(pool)
 
 
 @pytest_asyncio.fixture
 async def authenticated_client(
     app_client: AsyncClient,
     db_session: AsyncSession,
+    device_tokens: Iterator[tuple[uuid.UUID, str, str]],
 ) -> AsyncIterator[tuple[AsyncClient, uuid.UUID]]:
     """Create authenticated test client with a registered device.
 
@@ -124,8 +301,7 @@ async def authenticated_client(
         tuple[AsyncClient, uuid.UUID]: (client with auth header, device_id)
     """
     # Create a device
-    device_id = uuid.uuid4()
-    token, token_hash = issue_device_token(device_id)
+    device_id, token, token_hash = next(device_tokens)
     device = Device(id=device_id, token_hash=token_hash)
     db_session.add(device)
     await db_session.flush()
@@ -133,7 +309,8 @@ async def authenticated_client(
     # Add Authorization header to client
     app_client.headers["Authorization"] = f"Bearer {token}"
 
-    yield app_client, device_id
-
-    # Cleanup auth header
-    app_client.headers.pop("Authorization", None)
+    try:
+        yield app_client, device_id
+    finally:
+        # Cleanup auth header
+        app_client.headers.pop("Authorization", None)
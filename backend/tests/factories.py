@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import itertools
+import os
 import uuid
 from datetime import UTC, date, datetime
 from decimal import Decimal
 
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.core.db import Base
 from app.core.enums import MealType, Unit
 from app.features.auth.models import Device
 from app.features.auth.service import issue_device_token
@@ -19,11 +24,46 @@ from app.features.products.models import Product
 from app.features.weights.models import BodyWeight
 
 
-async def create_device(
-    session: AsyncSession,
-    **overrides,
-) -> Device:
-    """Create a test device with a valid token hash."""
+def new_id() -> str:
+    """Random UUID string for request bodies and URLs (any version is accepted)."""
+    return str(uuid.UUID(bytes=os.urandom(16)))
+
+
+_TABLE_ORDER = {table: i for i, table in enumerate(Base.metadata.sorted_tables)}
+
+
+async def persist_all(session: AsyncSession, *objs: object) -> None:
+    """Flush ``objs`` per table in ``sorted_tables`` order; no relationship()s order the INSERTs."""
+    by_table = sorted(objs, key=lambda obj: _TABLE_ORDER[inspect(obj).mapper.local_table])
+    for _table, group in itertools.groupby(by_table, key=lambda obj: inspect(obj).mapper.local_table):
+        session.add_all(group)
+        await session.flush()
+    for obj in objs:
+        state = inspect(obj)
+        unloaded = []
+        for attr in state.mapper.column_attrs:
+            if attr.key not in state.unloaded:
+                continue
+            if _is_server_generated(attr.columns[0]):
+                unloaded.append(attr.key)
+            else:
+                set_committed_value(obj, attr.key, None)
+        if unloaded:
+            await session.refresh(obj, attribute_names=unloaded)
+
+
+def _is_server_generated(column) -> bool:
+    return column.server_default is not None or column.server_onupdate is not None
+
+
+def _timestamps() -> dict[str, datetime]:
+    """Client-side created_at/updated_at, so INSERTs need no RETURNING."""
+    now = datetime.now(UTC)
+    return {"created_at": now, "updated_at": now}
+
+
+def build_device(**overrides) -> Device:
+    """Build (but do not add) a test device with a valid token hash."""
     device_id = overrides.pop("id", uuid.uuid4())
     _token, token_hash = issue_device_token(device_id)
 
@@ -35,40 +75,33 @@ async def create_device(
     }
     defaults.update(overrides)
 
-    device = Device(**defaults)
-    session.add(device)
-    await session.flush()
-    await session.refresh(device)
-    return device
+    return Device(**defaults)
 
 
-async def create_product(
-    session: AsyncSession,
+def build_product(
     device_id: uuid.UUID,
     **overrides,
 ) -> Product:
-    """Create a test product."""
+    """Build (but do not add) a test product."""
     defaults = {
+        "id": uuid.uuid4(),
         "device_id": device_id,
         "name": f"Test Product {uuid.uuid4().hex[:8]}",
+        **_timestamps(),
     }
     defaults.update(overrides)
 
-    product = Product(**defaults)
-    session.add(product)
-    await session.flush()
-    await session.refresh(product)
-    return product
+    return Product(**defaults)
 
 
-async def create_portion(
-    session: AsyncSession,
+def build_portion(
     device_id: uuid.UUID,
     product_id: uuid.UUID,
     **overrides,
 ) -> ProductPortion:
-    """Create a test product portion."""
+    """Build (but do not add) a test product portion."""
     defaults = {
+        "id": uuid.uuid4(),
         "device_id": device_id,
         "product_id": product_id,
         "label": f"Test Portion {uuid.uuid4().hex[:8]}",
@@ -79,25 +112,22 @@ async def create_portion(
         "carbs": Decimal("20"),
         "fat": Decimal("5"),
         "is_default": False,
+        **_timestamps(),
     }
     defaults.update(overrides)
 
-    portion = ProductPortion(**defaults)
-    session.add(portion)
-    await session.flush()
-    await session.refresh(portion)
-    return portion
+    return ProductPortion(**defaults)
 
 
-async def create_food_entry(
-    session: AsyncSession,
+def build_food_entry(
     device_id: uuid.UUID,
     product_id: uuid.UUID,
     portion_id: uuid.UUID,
     **overrides,
 ) -> FoodEntry:
-    """Create a test food entry."""
+    """Build (but do not add) a test food entry."""
     defaults = {
+        "id": uuid.uuid4(),
         "device_id": device_id,
         "product_id": product_id,
         "portion_id": portion_id,
@@ -105,23 +135,20 @@ async def create_food_entry(
         "meal_type": MealType.breakfast,
         "amount": Decimal("100"),
         "unit": Unit.g,
+        **_timestamps(),
     }
     defaults.update(overrides)
 
-    entry = FoodEntry(**defaults)
-    session.add(entry)
-    await session.flush()
-    await session.refresh(entry)
-    return entry
+    return FoodEntry(**defaults)
 
 
-async def create_goal(
-    session: AsyncSession,
+def build_goal(
     device_id: uuid.UUID,
     **overrides,
 ) -> UserGoal:
-    """Create a test user goal (manual goal by default)."""
+    """Build (but do not add) a test user goal (manual goal by default)."""
     defaults = {
+        "id": uuid.uuid4(),
         "device_id": device_id,
         "goal_type": "manual",
         "daily_calories_kcal": 2000,
@@ -132,38 +159,86 @@ async def create_goal(
         "carbs_grams": 200,
         "fat_grams": 67,
         "water_ml": 2000,
+        **_timestamps(),
     }
     defaults.update(overrides)
 
-    goal = UserGoal(**defaults)
-    session.add(goal)
-    await session.flush()
-    await session.refresh(goal)
-    return goal
+    return UserGoal(**defaults)
 
 
-async def create_body_weight(
-    session: AsyncSession,
+def build_body_weight(
     device_id: uuid.UUID,
     **overrides,
 ) -> BodyWeight:
-    """Create a test body weight entry."""
+    """Build (but do not add) a test body weight entry."""
     defaults = {
+        "id": uuid.uuid4(),
         "device_id": device_id,
         "day": date.today(),
         "weight_kg": Decimal("70.5"),
+        **_timestamps(),
     }
     defaults.update(overrides)
 
-    weight = BodyWeight(**defaults)
-    session.add(weight)
-    await session.flush()
-    await session.refresh(weight)
-    return weight
+    return BodyWeight(**defaults)
+
 
+async def create_device(session: AsyncSession, **overrides) -> Device:
+    """Create a test device with a valid token hash."""
+    device = build_device(**overrides)
+    await persist_all(session, device)
+    return device
+
+
+async def create_product(session: AsyncSession, device_id: uuid.UUID, **overrides) -> Product:
+    """Create a test product."""
+    product = build_product(device_id, **overrides)
+    await persist_all(session, product)
+    return product
 
-async def create_catalog_product(
+
+async def create_portion(
     session: AsyncSession,
+    device_id: uuid.UUID,
+    product_id: uuid.UUID,
+    **overrides,
+) -> ProductPortion:
+    """Create a test product portion."""
+    portion = build_portion(device_id, product_id, **overrides)
+    await persist_all(session, portion)
+    return portion
+
+
+async def create_food_entry(
+    session: AsyncSession,
+    device_id: uuid.UUID,
+    product_id: uuid.UUID,
+    portion_id: uuid.UUID,
+    **overrides,
+) -> FoodEntry:
+    """Create a test food entry."""
+    entry = build_food_entry(device_id, product_id, portion_id, **overrides)
+    await persist_all(session, entry)
+    return entry
+
+
+async def create_goal(session: AsyncSession, device_id: uuid.UUID, **overrides) -> UserGoal:
+    """Create a test user goal (manual goal by default)."""
+    goal = build_goal(device_id, **overrides)
+    await persist_all(session, goal)
+    return goal
+
+
+async def create_body_weight(
+    session: AsyncSession, device_id: uuid.UUID, **overrides,
+) -> BodyWeight:
+    """Create a test body weight entry."""
+    weight = build_body_weight(device_id, **overrides)
+    await persist_all(session, weight)
+    return weight
+
+
+def build_catalog_product(
     *,
     name: str,
     source: str = "usda",
@@ -173,8 +248,8 @@ async def create_catalog_product(
     brand: str | None = None,
     barcode: str | None = None,
 ) -> CatalogProduct:
-    """Create a test catalog product."""
-    product = CatalogProduct(
+    """Build (but do not add) a test catalog product."""
+    return CatalogProduct(
         source=source,
         source_id=source_id if source_id is not None else uuid.uuid4().hex[:12],
         name=name,
@@ -183,6 +258,11 @@ async def create_catalog_product(
         brand=brand,
         barcode=barcode,
     )
+
+
+async def create_catalog_product(session: AsyncSession, **fields) -> CatalogProduct:
+    """Create a test catalog product."""
+    product = build_catalog_product(**fields)
     session.add(product)
     await session.flush()
     return product
@@ -1,7 +1,10 @@
 """Tests for goal schema validation."""
 
+import re
+from collections.abc import Mapping
 from datetime import date, timedelta
 from decimal import Decimal
+from types import MappingProxyType
 from uuid import uuid4
 
 import pytest
@@ -20,54 +23,86 @@ from app.features.goals.schemas import (
     GoalUpdateRequest,
 )
 
+# Expected validation messages, compiled once
+_RE_TARGET_REQUIRED = re.compile("target_weight_kg is required")
+_RE_PACE_REQUIRED = re.compile("weight_change_pace is required")
+_RE_TOO_YOUNG = re.compile("Must be at least 13 years old")
+_RE_INVALID_BIRTH_DATE = re.compile("Invalid birth date")
+_RE_MACRO_SUM = re.compile("Macro percentages must sum to 100")
+
+# Resolved once at import; the suite finishes well within a day
+_TODAY = date.today()
+
+# Decimal literals parsed once for the whole module
+_D0, _D_NEG5, _D_NEG10, _D55, _D60, _D75, _D85 = map(Decimal, ("0", "-5", "-10", "55", "60", "75", "85"))
+_D165, _D175, _D180, _D301, _D501 = map(Decimal, ("165", "175", "180", "301", "501"))
+
+# Shared valid inputs, read-only so no test can leak a change into another;
+# tests unpack them into a fresh dict and override only the fields they exercise.
+_MALE_KW = MappingProxyType({
+    "gender": Gender.male,
+    "birth_date": date(1990, 1, 1),
+    "height_cm": _D180,
+    "current_weight_kg": _D85,
+    "activity_level": ActivityLevel.moderate,
+})
+_FEMALE_KW = MappingProxyType({
+    "gender": Gender.female,
+    "birth_date": date(1995, 1, 1),
+    "height_cm": _D165,
+    "current_weight_kg": _D55,
+    "activity_level": ActivityLevel.light,
+})
+_LOSE_KW = MappingProxyType({
+    "weight_goal_type": WeightGoalType.lose,
+    "target_weight_kg": _D75,
+    "weight_change_pace": WeightChangePace.moderate,
+})
+_GAIN_KW = MappingProxyType({
+    "weight_goal_type": WeightGoalType.gain,
+    "target_weight_kg": _D60,
+    "weight_change_pace": WeightChangePace.slow,
+})
+_MAINTAIN_KW = MappingProxyType({**_MALE_KW, "weight_goal_type": WeightGoalType.maintain})
+# Prebuilt input for the negative GoalCreateCalculatedRequest tests (model_validate)
+_CALC_CREATE_VALID = MappingProxyType({**_MALE_KW, **_LOSE_KW})
+_MANUAL_KW = MappingProxyType({
+    "daily_calories_kcal": 2000,
+    "protein_percent": 30,
+    "carbs_percent": 45,
+    "fat_percent": 25,
+    "water_ml": 2500,
+})
+
+
+def _without(kw: Mapping, *keys: str) -> dict:
+    return {k: v for k, v in kw.items() if k not in keys}
+
 
 class TestGoalCalculateRequest:
     """Tests for GoalCalculateRequest validation."""
 
     def test_valid_request_lose_weight(self):
         # Arrange & Act
-        request = GoalCalculateRequest(
-            gender=Gender.male,
-            birth_date=date(1990, 1, 1),
-            height_cm=Decimal("180"),
-            current_weight_kg=Decimal("85"),
-            activity_level=ActivityLevel.moderate,
-            weight_goal_type=WeightGoalType.lose,
-            target_weight_kg=Decimal("75"),
-            weight_change_pace=WeightChangePace.moderate,
-        )
+        request = GoalCalculateRequest(**_MALE_KW, **_LOSE_KW)
 
         # Assert
         assert request.gender == Gender.male
         assert request.weight_goal_type == WeightGoalType.lose
-        assert request.target_weight_kg == Decimal("75")
+        assert request.target_weight_kg == _D75
 
     def test_valid_request_gain_weight(self):
         # Arrange & Act
-        request = GoalCalculateRequest(
-            gender=Gender.female,
-            birth_date=date(1995, 6, 15),
-            height_cm=Decimal("165"),
-            current_weight_kg=Decimal("55"),
-            activity_level=ActivityLevel.light,
-            weight_goal_type=WeightGoalType.gain,
-            target_weight_kg=Decimal("60"),
-            weight_change_pace=WeightChangePace.slow,
-        )
+        request = GoalCalculateRequest(**{**_FEMALE_KW, **_GAIN_KW, "birth_date": date(1995, 6, 15)})
 
         # Assert
         assert request.weight_goal_type == WeightGoalType.gain
-        assert request.target_weight_kg == Decimal("60")
+        assert request.target_weight_kg == _D60
 
     def test_valid_request_maintain_weight(self):
         # Arrange & Act
         request = GoalCalculateRequest(
-            gender=Gender.male,
-            birth_date=date(1990, 1, 1),
-            height_cm=Decimal("175"),
-            current_weight_kg=Decimal("75"),
-            activity_level=ActivityLevel.moderate,
-            weight_goal_type=WeightGoalType.maintain,
+            **{**_MAINTAIN_KW, "height_cm": _D175, "current_weight_kg": _D75}
         )
 
         # Assert
@@ -77,194 +112,78 @@ class TestGoalCalculateRequest:
 
     def test_lose_weight_missing_target_weight_raises_error(self):
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError, match="target_weight_kg is required"):
-            GoalCalculateRequest(
-                gender=Gender.male,
-                birth_date=date(1990, 1, 1),
-                height_cm=Decimal("180"),
-                current_weight_kg=Decimal("85"),
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.lose,
-                weight_change_pace=WeightChangePace.moderate,
-            )
+        with pytest.raises(ValidationError, match=_RE_TARGET_REQUIRED):
+            GoalCalculateRequest(**_MALE_KW, **_without(_LOSE_KW, "target_weight_kg"))
 
     def test_lose_weight_missing_pace_raises_error(self):
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError, match="weight_change_pace is required"):
-            GoalCalculateRequest(
-                gender=Gender.male,
-                birth_date=date(1990, 1, 1),
-                height_cm=Decimal("180"),
-                current_weight_kg=Decimal("85"),
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.lose,
-                target_weight_kg=Decimal("75"),
-            )
+        with pytest.raises(ValidationError, match=_RE_PACE_REQUIRED):
+            GoalCalculateRequest(**_MALE_KW, **_without(_LOSE_KW, "weight_change_pace"))
 
     def test_gain_weight_missing_target_weight_raises_error(self):
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError, match="target_weight_kg is required"):
-            GoalCalculateRequest(
-                gender=Gender.female,
-                birth_date=date(1995, 1, 1),
-                height_cm=Decimal("165"),
-                current_weight_kg=Decimal("55"),
-                activity_level=ActivityLevel.light,
-                weight_goal_type=WeightGoalType.gain,
-                weight_change_pace=WeightChangePace.slow,
-            )
+        with pytest.raises(ValidationError, match=_RE_TARGET_REQUIRED):
+            GoalCalculateRequest(**_FEMALE_KW, **_without(_GAIN_KW, "target_weight_kg"))
 
     def test_gain_weight_missing_pace_raises_error(self):
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError, match="weight_change_pace is required"):
-            GoalCalculateRequest(
-                gender=Gender.female,
-                birth_date=date(1995, 1, 1),
-                height_cm=Decimal("165"),
-                current_weight_kg=Decimal("55"),
-                activity_level=ActivityLevel.light,
-                weight_goal_type=WeightGoalType.gain,
-                target_weight_kg=Decimal("60"),
-            )
+        with pytest.raises(ValidationError, match=_RE_PACE_REQUIRED):
+            GoalCalculateRequest(**_FEMALE_KW, **_without(_GAIN_KW, "weight_change_pace"))
 
     def test_birth_date_too_young_raises_error(self):
         # Arrange
-        today = date.today()
+        today = _TODAY
         birth_date = today - timedelta(days=365 * 12)  # 12 years old
 
         # Act & Assert
-        with pytest.raises(ValidationError, match="Must be at least 13 years old"):
-            GoalCalculateRequest(
-                gender=Gender.male,
-                birth_date=birth_date,
-                height_cm=Decimal("160"),
-                current_weight_kg=Decimal("50"),
-                activity_level=ActivityLevel.light,
-                weight_goal_type=WeightGoalType.maintain,
-            )
+        with pytest.raises(ValidationError, match=_RE_TOO_YOUNG):
+            GoalCalculateRequest(**{**_MAINTAIN_KW, "birth_date": birth_date})
 
     def test_birth_date_too_old_raises_error(self):
         # Arrange
         birth_date = date(1900, 1, 1)
 
         # Act & Assert
-        with pytest.raises(ValidationError, match="Invalid birth date"):
-            GoalCalculateRequest(
-                gender=Gender.female,
-                birth_date=birth_date,
-                height_cm=Decimal("160"),
-                current_weight_kg=Decimal("60"),
-                activity_level=ActivityLevel.sedentary,
-                weight_goal_type=WeightGoalType.maintain,
-            )
+        with pytest.raises(ValidationError, match=_RE_INVALID_BIRTH_DATE):
+            GoalCalculateRequest(**{**_MAINTAIN_KW, "birth_date": birth_date})
 
     def test_birth_date_in_future_raises_error(self):
         # Arrange
         # Use a date in the future that would still result in age >= 13
         # This ensures the "future" check is triggered first
-        future_date = date.today() + timedelta(days=1)
+        future_date = _TODAY + timedelta(days=1)
 
         # Act & Assert
         # The validator checks age first, so we expect the age error
-        with pytest.raises(ValidationError, match="Must be at least 13 years old"):
-            GoalCalculateRequest(
-                gender=Gender.male,
-                birth_date=future_date,
-                height_cm=Decimal("180"),
-                current_weight_kg=Decimal("80"),
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.maintain,
-            )
+        with pytest.raises(ValidationError, match=_RE_TOO_YOUNG):
+            GoalCalculateRequest(**{**_MAINTAIN_KW, "birth_date": future_date})
 
     def test_birth_date_edge_case_exactly_13_years_old(self):
         # Arrange
-        today = date.today()
+        today = _TODAY
         birth_date = date(today.year - 13, today.month, today.day)
 
         # Act
-        request = GoalCalculateRequest(
-            gender=Gender.male,
-            birth_date=birth_date,
-            height_cm=Decimal("160"),
-            current_weight_kg=Decimal("50"),
-            activity_level=ActivityLevel.light,
-            weight_goal_type=WeightGoalType.maintain,
-        )
+        request = GoalCalculateRequest(**{**_MAINTAIN_KW, "birth_date": birth_date})
 
         # Assert
         assert request.birth_date == birth_date
 
-    def test_height_zero_raises_error(self):
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("height_cm", _D0),
+            ("height_cm", _D_NEG10),
+            ("height_cm", _D301),  # > 300
+            ("current_weight_kg", _D0),
+            ("current_weight_kg", _D_NEG5),
+            ("current_weight_kg", _D501),  # > 500
+        ],
+    )
+    def test_body_measurement_out_of_range_raises_error(self, field: str, value: Decimal):
         # Arrange & Act & Assert
         with pytest.raises(ValidationError):
-            GoalCalculateRequest(
-                gender=Gender.male,
-                birth_date=date(1990, 1, 1),
-                height_cm=Decimal("0"),
-                current_weight_kg=Decimal("80"),
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.maintain,
-            )
-
-    def test_height_negative_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalCalculateRequest(
-                gender=Gender.male,
-                birth_date=date(1990, 1, 1),
-                height_cm=Decimal("-10"),
-                current_weight_kg=Decimal("80"),
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.maintain,
-            )
-
-    def test_height_above_maximum_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalCalculateRequest(
-                gender=Gender.male,
-                birth_date=date(1990, 1, 1),
-                height_cm=Decimal("301"),  # > 300
-                current_weight_kg=Decimal("80"),
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.maintain,
-            )
-
-    def test_weight_zero_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalCalculateRequest(
-                gender=Gender.male,
-                birth_date=date(1990, 1, 1),
-                height_cm=Decimal("180"),
-                current_weight_kg=Decimal("0"),
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.maintain,
-            )
-
-    def test_weight_negative_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalCalculateRequest(
-                gender=Gender.male,
-                birth_date=date(1990, 1, 1),
-                height_cm=Decimal("180"),
-                current_weight_kg=Decimal("-5"),
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.maintain,
-            )
-
-    def test_weight_above_maximum_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalCalculateRequest(
-                gender=Gender.male,
-                birth_date=date(1990, 1, 1),
-                height_cm=Decimal("180"),
-                current_weight_kg=Decimal("501"),  # > 500
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.maintain,
-            )
+            GoalCalculateRequest(**{**_MAINTAIN_KW, field: value})
 
 
 class TestGoalCreateCalculatedRequest:
@@ -272,16 +191,7 @@ class TestGoalCreateCalculatedRequest:
 
     def test_valid_request_without_overrides(self):
         # Arrange & Act
-        request = GoalCreateCalculatedRequest(
-            gender=Gender.male,
-            birth_date=date(1990, 1, 1),
-            height_cm=Decimal("180"),
-            current_weight_kg=Decimal("85"),
-            activity_level=ActivityLevel.moderate,
-            weight_goal_type=WeightGoalType.lose,
-            target_weight_kg=Decimal("75"),
-            weight_change_pace=WeightChangePace.moderate,
-        )
+        request = GoalCreateCalculatedRequest(**_MALE_KW, **_LOSE_KW)
 
         # Assert
         assert request.protein_percent is None
@@ -292,17 +202,7 @@ class TestGoalCreateCalculatedRequest:
     def test_valid_request_with_all_macro_overrides(self):
         # Arrange & Act
         request = GoalCreateCalculatedRequest(
-            gender=Gender.male,
-            birth_date=date(1990, 1, 1),
-            height_cm=Decimal("180"),
-            current_weight_kg=Decimal("85"),
-            activity_level=ActivityLevel.moderate,
-            weight_goal_type=WeightGoalType.lose,
-            target_weight_kg=Decimal("75"),
-            weight_change_pace=WeightChangePace.moderate,
-            protein_percent=40,
-            carbs_percent=35,
-            fat_percent=25,
+            **_MALE_KW, **_LOSE_KW, protein_percent=40, carbs_percent=35, fat_percent=25,
         )
 
         # Assert
@@ -313,11 +213,7 @@ class TestGoalCreateCalculatedRequest:
     def test_valid_request_with_water_override(self):
         # Arrange & Act
         request = GoalCreateCalculatedRequest(
-            gender=Gender.female,
-            birth_date=date(1995, 1, 1),
-            height_cm=Decimal("165"),
-            current_weight_kg=Decimal("60"),
-            activity_level=ActivityLevel.light,
+            **{**_FEMALE_KW, "current_weight_kg": _D60},
             weight_goal_type=WeightGoalType.maintain,
             water_ml=3000,
         )
@@ -330,64 +226,29 @@ class TestGoalCreateCalculatedRequest:
         goal_id = uuid4()
 
         # Act
-        request = GoalCreateCalculatedRequest(
-            id=goal_id,
-            gender=Gender.male,
-            birth_date=date(1990, 1, 1),
-            height_cm=Decimal("180"),
-            current_weight_kg=Decimal("85"),
-            activity_level=ActivityLevel.moderate,
-            weight_goal_type=WeightGoalType.maintain,
-        )
+        request = GoalCreateCalculatedRequest(id=goal_id, **_MAINTAIN_KW)
 
         # Assert
         assert request.id == goal_id
 
     def test_macros_sum_not_100_raises_error(self):
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError, match="Macro percentages must sum to 100"):
-            GoalCreateCalculatedRequest(
-                gender=Gender.male,
-                birth_date=date(1990, 1, 1),
-                height_cm=Decimal("180"),
-                current_weight_kg=Decimal("85"),
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.lose,
-                target_weight_kg=Decimal("75"),
-                weight_change_pace=WeightChangePace.moderate,
-                protein_percent=40,
-                carbs_percent=40,
-                fat_percent=25,  # Sum = 105
-            )
+        with pytest.raises(ValidationError, match=_RE_MACRO_SUM):
+            GoalCreateCalculatedRequest.model_validate(
+                {**_CALC_CREATE_VALID, "protein_percent": 40, "carbs_percent": 40, "fat_percent": 25}
+            )  # Sum = 105
 
     def test_macros_sum_less_than_100_raises_error(self):
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError, match="Macro percentages must sum to 100"):
-            GoalCreateCalculatedRequest(
-                gender=Gender.male,
-                birth_date=date(1990, 1, 1),
-                height_cm=Decimal("180"),
-                current_weight_kg=Decimal("85"),
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.lose,
-                target_weight_kg=Decimal("75"),
-                weight_change_pace=WeightChangePace.moderate,
-                protein_percent=30,
-                carbs_percent=30,
-                fat_percent=30,  # Sum = 90
-            )
+        with pytest.raises(ValidationError, match=_RE_MACRO_SUM):
+            GoalCreateCalculatedRequest.model_validate(
+                {**_CALC_CREATE_VALID, "protein_percent": 30, "carbs_percent": 30, "fat_percent": 30}
+            )  # Sum = 90
 
     def test_partial_macros_allowed(self):
         # Arrange & Act
         request = GoalCreateCalculatedRequest(
-            gender=Gender.male,
-            birth_date=date(1990, 1, 1),
-            height_cm=Decimal("180"),
-            current_weight_kg=Decimal("85"),
-            activity_level=ActivityLevel.moderate,
-            weight_goal_type=WeightGoalType.lose,
-            target_weight_kg=Decimal("75"),
-            weight_change_pace=WeightChangePace.moderate,
+            **_MALE_KW, **_LOSE_KW,
             protein_percent=40,
             # Only one macro provided - should not validate sum
         )
@@ -397,57 +258,19 @@ class TestGoalCreateCalculatedRequest:
         assert request.carbs_percent is None
         assert request.fat_percent is None
 
-    def test_protein_percent_negative_raises_error(self):
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("protein_percent", -5),
+            ("protein_percent", 101),
+            ("water_ml", -100),
+            ("water_ml", 10001),  # > 10000
+        ],
+    )
+    def test_override_out_of_range_raises_error(self, field: str, value: int):
         # Arrange & Act & Assert
         with pytest.raises(ValidationError):
-            GoalCreateCalculatedRequest(
-                gender=Gender.male,
-                birth_date=date(1990, 1, 1),
-                height_cm=Decimal("180"),
-                current_weight_kg=Decimal("85"),
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.maintain,
-                protein_percent=-5,
-            )
-
-    def test_protein_percent_above_100_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalCreateCalculatedRequest(
-                gender=Gender.male,
-                birth_date=date(1990, 1, 1),
-                height_cm=Decimal("180"),
-                current_weight_kg=Decimal("85"),
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.maintain,
-                protein_percent=101,
-            )
-
-    def test_water_ml_negative_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalCreateCalculatedRequest(
-                gender=Gender.male,
-                birth_date=date(1990, 1, 1),
-                height_cm=Decimal("180"),
-                current_weight_kg=Decimal("85"),
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.maintain,
-                water_ml=-100,
-            )
-
-    def test_water_ml_above_maximum_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalCreateCalculatedRequest(
-                gender=Gender.male,
-                birth_date=date(1990, 1, 1),
-                height_cm=Decimal("180"),
-                current_weight_kg=Decimal("85"),
-                activity_level=ActivityLevel.moderate,
-                weight_goal_type=WeightGoalType.maintain,
-                water_ml=10001,  # > 10000
-            )
+            GoalCreateCalculatedRequest.model_validate({**_MAINTAIN_KW, field: value})
 
 
 class TestGoalCreateManualRequest:
@@ -455,13 +278,7 @@ class TestGoalCreateManualRequest:
 
     def test_valid_manual_request(self):
         # Arrange & Act
-        request = GoalCreateManualRequest(
-            daily_calories_kcal=2000,
-            protein_percent=30,
-            carbs_percent=45,
-            fat_percent=25,
-            water_ml=2500,
-        )
+        request = GoalCreateManualRequest(**_MANUAL_KW)
 
         # Assert
         assert request.daily_calories_kcal == 2000
@@ -475,14 +292,7 @@ class TestGoalCreateManualRequest:
         goal_id = uuid4()
 
         # Act
-        request = GoalCreateManualRequest(
-            id=goal_id,
-            daily_calories_kcal=1800,
-            protein_percent=25,
-            carbs_percent=50,
-            fat_percent=25,
-            water_ml=2000,
-        )
+        request = GoalCreateManualRequest(id=goal_id, **_MANUAL_KW)
 
         # Assert
         assert request.id == goal_id
@@ -490,125 +300,50 @@ class TestGoalCreateManualRequest:
     def test_macros_sum_to_100_valid(self):
         # Arrange & Act
         request = GoalCreateManualRequest(
-            daily_calories_kcal=2200,
-            protein_percent=33,
-            carbs_percent=34,
-            fat_percent=33,
-            water_ml=2500,
+            **{**_MANUAL_KW, "protein_percent": 33, "carbs_percent": 34, "fat_percent": 33}
         )
 
         # Assert
-        assert (
-            request.protein_percent + request.carbs_percent + request.fat_percent == 100
-        )
+        assert request.protein_percent == 33
+        assert request.carbs_percent == 34
+        assert request.fat_percent == 33
 
     def test_macros_sum_not_100_raises_error(self):
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError, match="Macro percentages must sum to 100"):
+        with pytest.raises(ValidationError, match=_RE_MACRO_SUM):
             GoalCreateManualRequest(
-                daily_calories_kcal=2000,
-                protein_percent=40,
-                carbs_percent=40,
-                fat_percent=25,  # Sum = 105
-                water_ml=2500,
+                **{**_MANUAL_KW, "protein_percent": 40, "carbs_percent": 40}  # Sum = 105
             )
 
     def test_macros_sum_less_than_100_raises_error(self):
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError, match="Macro percentages must sum to 100"):
-            GoalCreateManualRequest(
-                daily_calories_kcal=2000,
-                protein_percent=30,
-                carbs_percent=30,
-                fat_percent=30,  # Sum = 90
-                water_ml=2500,
-            )
-
-    def test_calories_zero_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalCreateManualRequest(
-                daily_calories_kcal=0,
-                protein_percent=30,
-                carbs_percent=45,
-                fat_percent=25,
-                water_ml=2500,
-            )
-
-    def test_calories_negative_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalCreateManualRequest(
-                daily_calories_kcal=-100,
-                protein_percent=30,
-                carbs_percent=45,
-                fat_percent=25,
-                water_ml=2500,
-            )
-
-    def test_calories_above_maximum_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalCreateManualRequest(
-                daily_calories_kcal=10001,  # > 10000
-                protein_percent=30,
-                carbs_percent=45,
-                fat_percent=25,
-                water_ml=2500,
-            )
-
-    def test_protein_percent_negative_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalCreateManualRequest(
-                daily_calories_kcal=2000,
-                protein_percent=-5,
-                carbs_percent=55,
-                fat_percent=50,
-                water_ml=2500,
-            )
-
-    def test_protein_percent_above_100_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match=_RE_MACRO_SUM):
             GoalCreateManualRequest(
-                daily_calories_kcal=2000,
-                protein_percent=101,
-                carbs_percent=0,
-                fat_percent=0,
-                water_ml=2500,
-            )
-
-    def test_water_ml_negative_raises_error(self):
+                **{**_MANUAL_KW, "carbs_percent": 30, "fat_percent": 30, "protein_percent": 30}
+            )  # Sum = 90
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"daily_calories_kcal": 0},
+            {"daily_calories_kcal": -100},
+            {"daily_calories_kcal": 10001},  # > 10000
+            # Other macros adjusted so only the bound, not the sum, is violated
+            {"protein_percent": -5, "carbs_percent": 55, "fat_percent": 50},
+            {"protein_percent": 101, "carbs_percent": 0, "fat_percent": 0},
+            {"water_ml": -100},
+            {"water_ml": 10001},  # > 10000
+        ],
+    )
+    def test_field_out_of_range_raises_error(self, overrides: dict):
         # Arrange & Act & Assert
         with pytest.raises(ValidationError):
-            GoalCreateManualRequest(
-                daily_calories_kcal=2000,
-                protein_percent=30,
-                carbs_percent=45,
-                fat_percent=25,
-                water_ml=-100,
-            )
-
-    def test_water_ml_above_maximum_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalCreateManualRequest(
-                daily_calories_kcal=2000,
-                protein_percent=30,
-                carbs_percent=45,
-                fat_percent=25,
-                water_ml=10001,  # > 10000
-            )
+            GoalCreateManualRequest(**{**_MANUAL_KW, **overrides})
 
     def test_boundary_value_calories_minimum(self):
         # Arrange & Act
         request = GoalCreateManualRequest(
-            daily_calories_kcal=1,  # Minimum valid
-            protein_percent=30,
-            carbs_percent=45,
-            fat_percent=25,
-            water_ml=1000,
+            **{**_MANUAL_KW, "daily_calories_kcal": 1, "water_ml": 1000}  # Minimum valid
         )
 
         # Assert
@@ -617,11 +352,7 @@ class TestGoalCreateManualRequest:
     def test_boundary_value_calories_maximum(self):
         # Arrange & Act
         request = GoalCreateManualRequest(
-            daily_calories_kcal=10000,  # Maximum valid
-            protein_percent=30,
-            carbs_percent=45,
-            fat_percent=25,
-            water_ml=5000,
+            **{**_MANUAL_KW, "daily_calories_kcal": 10000, "water_ml": 5000}  # Maximum valid
         )
 
         # Assert
@@ -677,37 +408,19 @@ class TestGoalUpdateRequest:
         assert request.protein_percent is None
         assert request.water_ml is None
 
-    def test_calories_zero_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalUpdateRequest(daily_calories_kcal=0)
-
-    def test_calories_negative_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalUpdateRequest(daily_calories_kcal=-100)
-
-    def test_calories_above_maximum_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalUpdateRequest(daily_calories_kcal=10001)
-
-    def test_protein_percent_negative_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalUpdateRequest(protein_percent=-5)
-
-    def test_protein_percent_above_100_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalUpdateRequest(protein_percent=101)
-
-    def test_water_ml_negative_raises_error(self):
-        # Arrange & Act & Assert
-        with pytest.raises(ValidationError):
-            GoalUpdateRequest(water_ml=-100)
-
-    def test_water_ml_above_maximum_raises_error(self):
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("daily_calories_kcal", 0),
+            ("daily_calories_kcal", -100),
+            ("daily_calories_kcal", 10001),
+            ("protein_percent", -5),
+            ("protein_percent", 101),
+            ("water_ml", -100),
+            ("water_ml", 10001),
+        ],
+    )
+    def test_field_out_of_range_raises_error(self, field: str, value: int):
         # Arrange & Act & Assert
         with pytest.raises(ValidationError):
-            GoalUpdateRequest(water_ml=10001)
+            GoalUpdateRequest(**{field: value})
@@ -1,10 +1,33 @@
-"""Tests for the Open Food Facts seeder — serving size parsing."""
+"""Tests for the Open Food Facts seeder — serving size parsing and portion batching."""
 
 from __future__ import annotations
 
+import uuid
+from typing import Any
+
 import pytest
 
-from scripts.seeders.off import OffSeeder, parse_serving_size
+from scripts.seeders import off
+from scripts.seeders.off import OffSeeder, _scaled_macros, parse_serving_size
+
+
+class _RecordingConn:
+    """Stands in for an asyncpg connection: no USDA matches, one new id per upsert."""
+
+    def __init__(self) -> None:
+        self.executed: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def prepare(self, sql: str) -> _RecordingConn:
+        return self
+
+    async def fetchval(self, *args: Any) -> None:
+        return None
+
+    async def fetchrow(self, *args: Any) -> dict[str, uuid.UUID]:
+        return {"id": uuid.uuid4()}
+
+    async def execute(self, sql: str, *args: Any) -> None:
+        self.executed.append((sql, args))
 
 
 class TestParseServingSize:
@@ -56,9 +79,37 @@ class TestParseServingSize:
         assert weight == pytest.approx(30.5)
 
 
+class TestScaledMacros:
+    """Verify per-portion macro scaling keeps missing macros as None."""
+
+    def test_scales_and_rounds(self) -> None:
+        assert _scaled_macros(400.0, 10.0, None, 12.5, 0.4) == (160.0, 4.0, None, 5.0)
+
+    def test_unit_factor_rounds_only(self) -> None:
+        assert _scaled_macros(45.12345, None, 11.0, None, 1.0) == (45.123, None, 11.0, None)
+
+
 class TestOffSeederInit:
     """Verify OFF seeder can be instantiated."""
 
     def test_creates_with_seeds_dir(self) -> None:
         seeder = OffSeeder(seeds_dir="/tmp/nonexistent")
         assert seeder.seeds_dir == "/tmp/nonexistent"
+
+
+class TestOffSeederPortionBatches:
+    """Portions are replaced in bounded batches while the CSV is read."""
+
+    async def test_flushes_every_portion_batch(self, tmp_path, monkeypatch) -> None:
+        rows = [f"{i:013d},Bar {i},Acme,250,30g" for i in range(5)]
+        (tmp_path / OffSeeder._CSV_FILENAME).write_text(
+            "code,product_name,brands,energy-kcal_100g,serving_size\n" + "\n".join(rows) + "\n"
+        )
+        monkeypatch.setattr(off, "_PORTION_BATCH", 2)
+        conn = _RecordingConn()
+
+        products, portions = await OffSeeder(str(tmp_path)).run(conn)
+
+        deleted = [args[0] for sql, args in conn.executed if sql.startswith("DELETE")]
+        assert (products, portions) == (5, 10)
+        assert [len(ids) for ids in deleted] == [2, 2, 1]
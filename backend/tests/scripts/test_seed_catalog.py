@@ -0,0 +1,89 @@
+"""Tests for the seed_catalog entry point — database URL helpers and index rebuild."""
+
+from __future__ import annotations
+
+import pytest
+
+from scripts.seed_catalog import (
+    _asyncpg_url,
+    _create_secondary_indexes,
+    _drop_secondary_indexes,
+    _load_database_url,
+    _parse_args,
+)
+
+
+class _RecordingConn:
+    """Stands in for an asyncpg connection and keeps every statement executed."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    async def execute(self, sql: str) -> None:
+        self.statements.append(sql)
+
+
+class TestAsyncpgUrl:
+    """Verify _asyncpg_url normalises every postgres scheme variant."""
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("postgresql+asyncpg://u:p@h/db", "postgresql://u:p@h/db"),
+            ("postgres+asyncpg://u:p@h/db", "postgresql://u:p@h/db"),
+            ("postgres://u:p@h/db", "postgresql://u:p@h/db"),
+            ("postgresql://u:p@h/db", "postgresql://u:p@h/db"),
+        ],
+    )
+    def test_normalises_scheme(self, url: str, expected: str) -> None:
+        assert _asyncpg_url(url) == expected
+
+
+class TestLoadDatabaseUrl:
+    """Verify _load_database_url reads the environment once."""
+
+    def test_result_is_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        _load_database_url.cache_clear()
+        monkeypatch.setenv("DATABASE_URL", "postgresql+asyncpg://u:p@h/first")
+        assert _load_database_url() == "postgresql://u:p@h/first"
+
+        monkeypatch.setenv("DATABASE_URL", "postgresql+asyncpg://u:p@h/second")
+        assert _load_database_url() == "postgresql://u:p@h/first"
+        _load_database_url.cache_clear()
+
+
+class TestParseArgs:
+    """Verify CLI flags."""
+
+    def test_rebuild_indexes_defaults_off(self) -> None:
+        assert _parse_args([]).rebuild_indexes is False
+
+    def test_rebuild_indexes_flag(self) -> None:
+        assert _parse_args(["--rebuild-indexes"]).rebuild_indexes is True
+
+    def test_low_memory_defaults_off(self) -> None:
+        assert _parse_args([]).low_memory is False
+
+    def test_low_memory_flag(self) -> None:
+        assert _parse_args(["--low-memory"]).low_memory is True
+
+
+class TestSecondaryIndexes:
+    """Verify --rebuild-indexes drops and recreates the expensive search indexes."""
+
+    async def test_drops_trigram_index(self) -> None:
+        conn = _RecordingConn()
+
+        await _drop_secondary_indexes(conn)
+
+        assert "DROP INDEX IF EXISTS ix_catalog_products_display_name_trgm" in conn.statements
+
+    async def test_recreates_trigram_index(self) -> None:
+        conn = _RecordingConn()
+
+        await _create_secondary_indexes(conn)
+
+        assert (
+            "CREATE INDEX ix_catalog_products_display_name_trgm "
+            "ON catalog_products USING gin (display_name gin_trgm_ops)"
+        ) in conn.statements
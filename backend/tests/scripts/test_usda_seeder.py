@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
-from scripts.seeders.base import normalize_unit
+from scripts.seeders import usda
+from scripts.seeders.base import extract_macros_per_100g, normalize_unit
 from scripts.seeders.usda import UsdaSeeder
 
 
@@ -45,6 +48,36 @@ class TestNormalizeUnit:
     def test_maps_package_to_serving(self) -> None:
         assert normalize_unit("package", None) == "serving"
 
+    def test_unsupported_alias_falls_back_to_name(self) -> None:
+        assert normalize_unit("ounce", "tablespoon") == "tbsp"
+
+    def test_repeated_calls_hit_cache(self) -> None:
+        normalize_unit.cache_clear()
+        normalize_unit("slice", None)
+        normalize_unit("slice", None)
+        assert normalize_unit.cache_info().hits == 1
+
+
+class TestExtractMacros:
+    """Verify extract_macros_per_100g picks the four target nutrients."""
+
+    def test_skips_entries_without_nutrient_and_keeps_last_duplicate(self) -> None:
+        food = {
+            "foodNutrients": [
+                {"amount": 1.0},
+                {"nutrient": {"name": "Energy"}, "amount": 52},
+                {"nutrient": {"name": "Fiber, total dietary"}, "amount": 2.4},
+                {"nutrient": {"name": "Protein"}, "amount": None},
+                {"nutrient": {"name": "Energy"}, "amount": 218},
+            ],
+        }
+        assert extract_macros_per_100g(food) == {
+            "fat_g_100g": None,
+            "carbs_g_100g": None,
+            "protein_g_100g": None,
+            "kcal_100g": 218.0,
+        }
+
 
 class TestUsdaSeederQualityGates:
     """Test quality gate methods in isolation (no DB)."""
@@ -97,3 +130,85 @@ class TestUsdaSeederQualityGates:
 
     def test_has_calories_accepts_positive(self, seeder: UsdaSeeder) -> None:
         assert seeder._has_calories(150.0) is True
+
+
+class TestFindSrLegacyFile:
+    """Verify SR Legacy file discovery in seeds_dir."""
+
+    def test_finds_matching_file_and_ignores_others(self, tmp_path) -> None:
+        (tmp_path / "off_products_filtered.csv").write_text("")
+        (tmp_path / "notes.json").write_text("{}")
+        (tmp_path / "FoodData_Central_sr_legacy_food_json_2021.json").write_text("{}")
+
+        found = UsdaSeeder(str(tmp_path))._find_sr_legacy_file()
+
+        assert found == str(tmp_path / "FoodData_Central_sr_legacy_food_json_2021.json")
+
+    def test_missing_dir_returns_none(self, tmp_path) -> None:
+        assert UsdaSeeder(str(tmp_path / "missing"))._find_sr_legacy_file() is None
+
+
+class TestUsdaSeederDryRun:
+    """Run the full parse pipeline against a small JSON file (no DB)."""
+
+    async def test_dry_run_counts_valid_foods(self, tmp_path) -> None:
+        foods = [
+            {
+                "fdcId": 1,
+                "description": "Apples, raw",
+                "foodNutrients": [{"nutrient": {"name": "Energy"}, "amount": 52}],
+            },
+            {"fdcId": 2, "description": "No calories", "foodNutrients": []},
+        ]
+        (tmp_path / "sr_legacy_test.json").write_text(json.dumps({"SRLegacyFoods": foods}))
+
+        products, portions = await UsdaSeeder(str(tmp_path)).run(None, dry_run=True)
+
+        assert (products, portions) == (1, 0)
+
+    def test_streamed_foods_match_full_load(self, tmp_path) -> None:
+        foods = [{"fdcId": i, "description": f"Food {i}", "foodNutrients": []} for i in (1, 2)]
+        path = tmp_path / "sr_legacy_test.json"
+        path.write_text(json.dumps({"SRLegacyFoods": foods}))
+
+        streamed = list(usda._iter_foods(str(path), stream=True))
+
+        assert streamed == list(usda._iter_foods(str(path))) == foods
+
+    def test_full_load_is_default_even_with_ijson(self, tmp_path, monkeypatch) -> None:
+        path = tmp_path / "sr_legacy_test.json"
+        path.write_text(json.dumps({"SRLegacyFoods": []}))
+        monkeypatch.setattr(usda, "ijson", None)
+
+        assert list(usda._iter_foods(str(path))) == []
+        with pytest.raises(RuntimeError, match="requires ijson"):
+            list(usda._iter_foods(str(path), stream=True))
+
+
+class TestUsdaSeederRows:
+    """Staging rows built for COPY (no DB)."""
+
+    def test_source_hash_ignores_key_order_but_not_values(self) -> None:
+        food = {"fdcId": 7, "description": "Apples, raw", "foodPortions": []}
+        reordered = {"foodPortions": [], "description": "Apples, raw", "fdcId": 7}
+        changed = {**food, "description": "Apples, dried"}
+
+        assert usda._source_hash(food) == usda._source_hash(reordered)
+        assert usda._source_hash(food) != usda._source_hash(changed)
+        assert len(usda._source_hash(food)) == 16
+
+    def test_portion_rows_default_first_and_unknown_units_skipped(self) -> None:
+        food = {
+            "fdcId": 7,
+            "foodPortions": [
+                {"gramWeight": 50, "value": 1, "measureUnit": {"abbreviation": "slice"}},
+                {"gramWeight": 5, "measureUnit": {"name": "bushel"}},
+            ],
+        }
+
+        rows = UsdaSeeder._portion_rows(food)
+
+        assert rows == [
+            ("7", "100 g", 100.0, "g", 100.0, True),
+            ("7", "1 slice", 1.0, "pcs", 50.0, False),
+        ]
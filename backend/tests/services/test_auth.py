@@ -13,12 +13,23 @@ from app.features.auth.service import (
     verify_device_token,
 )
 
+# For tests that only need "a device id"; fresh ids stay where uniqueness matters.
+_DEVICE_ID = uuid.UUID(int=0x1234_5678_9ABC_4DEF_8123_4567_89AB_CDEF)
+_DEVICE_ID_STR = str(_DEVICE_ID)
+
+
+@pytest.fixture(scope="module")
+def issued_triple() -> tuple[str, str, str]:
+    """One (token, token_hash, secret) triple for tests that only read it."""
+    token, token_hash = issue_device_token(_DEVICE_ID)
+    return token, token_hash, token.split(".", 1)[1]
+
 
 class TestIssueDeviceToken:
     """Tests for issue_device_token()."""
 
     def test_returns_token_and_hash(self) -> None:
-        device_id = uuid.uuid4()
+        device_id = _DEVICE_ID
         token, token_hash = issue_device_token(device_id)
 
         assert isinstance(token, str)
@@ -27,31 +38,33 @@ class TestIssueDeviceToken:
         assert len(token_hash) > 0
 
     def test_token_contains_device_id(self) -> None:
-        device_id = uuid.uuid4()
+        device_id = _DEVICE_ID
         token, _ = issue_device_token(device_id)
 
-        assert token.startswith(str(device_id))
+        assert token.startswith(_DEVICE_ID_STR)
 
     def test_token_format_is_device_id_dot_secret(self) -> None:
-        device_id = uuid.uuid4()
+        device_id = _DEVICE_ID
         token, _ = issue_device_token(device_id)
 
         parts = token.split(".", 1)
         assert len(parts) == 2
-        assert parts[0] == str(device_id)
+        assert parts[0] == _DEVICE_ID_STR
         assert len(parts[1]) > 10  # Secret should be reasonably long
 
     def test_hash_is_not_raw_secret(self) -> None:
-        device_id = uuid.uuid4()
+        device_id = _DEVICE_ID
         token, token_hash = issue_device_token(device_id)
         secret = token.split(".", 1)[1]
 
         assert token_hash != secret
 
-    def test_different_calls_produce_different_tokens(self) -> None:
-        device_id = uuid.uuid4()
-        token1, hash1 = issue_device_token(device_id)
-        token2, hash2 = issue_device_token(device_id)
+    def test_different_calls_produce_different_tokens(
+        self, issued_triple: tuple[str, str, str],
+    ) -> None:
+        # Same device id as the shared token, so only the secret can differ
+        token1, hash1, _ = issued_triple
+        token2, hash2 = issue_device_token(_DEVICE_ID)
 
         assert token1 != token2
         assert hash1 != hash2
@@ -60,15 +73,14 @@ class TestIssueDeviceToken:
 class TestParseDeviceToken:
     """Tests for parse_device_token()."""
 
-    def test_valid_token(self) -> None:
-        device_id = uuid.uuid4()
-        token, _ = issue_device_token(device_id)
+    def test_valid_token(self, issued_triple: tuple[str, str, str]) -> None:
+        token, _, _ = issued_triple
 
         parsed = parse_device_token(token)
 
         assert parsed is not None
         assert isinstance(parsed, ParsedDeviceToken)
-        assert parsed.device_id == device_id
+        assert parsed.device_id == _DEVICE_ID
         assert len(parsed.secret) > 0
 
     def test_invalid_format_no_dot(self) -> None:
@@ -87,29 +99,23 @@ class TestParseDeviceToken:
 class TestVerifyDeviceToken:
     """Tests for verify_device_token()."""
 
-    def test_correct_secret_verifies(self) -> None:
-        device_id = uuid.uuid4()
-        token, token_hash = issue_device_token(device_id)
-        secret = token.split(".", 1)[1]
+    def test_correct_secret_verifies(self, issued_triple: tuple[str, str, str]) -> None:
+        _, token_hash, secret = issued_triple
 
         assert verify_device_token(secret, token_hash) is True
 
-    def test_wrong_secret_fails(self) -> None:
-        device_id = uuid.uuid4()
-        _, token_hash = issue_device_token(device_id)
+    def test_wrong_secret_fails(self, issued_triple: tuple[str, str, str]) -> None:
+        _, token_hash, _ = issued_triple
 
         assert verify_device_token("wrong-secret", token_hash) is False
 
-    def test_empty_secret_fails(self) -> None:
-        device_id = uuid.uuid4()
-        _, token_hash = issue_device_token(device_id)
+    def test_empty_secret_fails(self, issued_triple: tuple[str, str, str]) -> None:
+        _, token_hash, _ = issued_triple
 
         assert verify_device_token("", token_hash) is False
 
-    def test_tampered_hash_fails(self) -> None:
-        device_id = uuid.uuid4()
-        token, _ = issue_device_token(device_id)
-        secret = token.split(".", 1)[1]
+    def test_tampered_hash_fails(self, issued_triple: tuple[str, str, str]) -> None:
+        _, _, secret = issued_triple
 
         assert verify_device_token(secret, "tampered-hash") is False
 
@@ -125,20 +131,21 @@ class TestHashSecret:
 
     def test_hash_is_hex_string(self) -> None:
         result = _hash_secret("test")
-        assert all(c in "0123456789abcdef" for c in result)
         assert len(result) == 64  # SHA-256 hex length
+        # fromhex raises on non-hex; the round trip also rejects uppercase/whitespace
+        assert bytes.fromhex(result).hex() == result
 
 
 class TestRoundTrip:
     """End-to-end: issue → parse → verify."""
 
-    @pytest.mark.parametrize("_run", range(3))
-    def test_full_cycle(self, _run: int) -> None:
-        device_id = uuid.uuid4()
-        token, token_hash = issue_device_token(device_id)
+    def test_full_cycle(self) -> None:
+        for _ in range(3):
+            device_id = uuid.uuid4()
+            token, token_hash = issue_device_token(device_id)
 
-        parsed = parse_device_token(token)
-        assert parsed is not None
-        assert parsed.device_id == device_id
+            parsed = parse_device_token(token)
+            assert parsed is not None
+            assert parsed.device_id == device_id
 
-        assert verify_device_token(parsed.secret, token_hash) is True
+            assert verify_device_token(parsed.secret, token_hash) is True
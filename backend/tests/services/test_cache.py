@@ -0,0 +1,47 @@
+"""Test the in-process TTL cache used by the service layer."""
+
+from __future__ import annotations
+
+from app.core import cache as cache_module
+from app.core.cache import TTLCache
+
+
+def test_get_returns_stored_value():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+
+def test_evicts_least_recently_used():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl_seconds=10)
+    cache.set("a", 1)
+
+    now[0] = 111.0
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_invalidate_removes_entry():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.invalidate("a")
+    cache.invalidate("never-set")
+
+    assert cache.get("a") is None
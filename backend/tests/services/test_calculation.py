@@ -9,173 +9,47 @@ from app.features.stats.calculation import (
     MacroTotals,
     calc_totals_for_entry,
     convert_unit,
+    sum_totals,
 )
 
 
 class TestConvertUnit:
     """Tests for convert_unit function."""
 
-    # Same unit conversions
-    def test_same_unit_returns_original_amount(self):
-        # Arrange
-        amount = Decimal("100")
-        unit = Unit.g
-
-        # Act
-        result = convert_unit(amount, unit, unit)
-
-        # Assert
-        assert result == amount
-
-    # Mass conversions
-    def test_grams_to_milligrams(self):
-        # Arrange
-        amount = Decimal("5")
-
-        # Act
-        result = convert_unit(amount, Unit.g, Unit.mg)
-
-        # Assert
-        assert result == Decimal("5000")
-
-    def test_grams_to_kilograms(self):
-        # Arrange
-        amount = Decimal("1500")
-
-        # Act
-        result = convert_unit(amount, Unit.g, Unit.kg)
-
-        # Assert
-        assert result == Decimal("1.5")
-
-    def test_kilograms_to_grams(self):
-        # Arrange
-        amount = Decimal("2.5")
-
-        # Act
-        result = convert_unit(amount, Unit.kg, Unit.g)
-
-        # Assert
-        assert result == Decimal("2500")
-
-    def test_milligrams_to_kilograms(self):
-        # Arrange
-        amount = Decimal("2500000")
-
-        # Act
-        result = convert_unit(amount, Unit.mg, Unit.kg)
-
-        # Assert
-        assert result == Decimal("2.5")
-
-    # Volume conversions
-    def test_liters_to_milliliters(self):
-        # Arrange
-        amount = Decimal("2")
-
-        # Act
-        result = convert_unit(amount, Unit.l, Unit.ml)
-
-        # Assert
-        assert result == Decimal("2000")
-
-    def test_milliliters_to_liters(self):
-        # Arrange
-        amount = Decimal("750")
-
-        # Act
-        result = convert_unit(amount, Unit.ml, Unit.l)
-
-        # Assert
-        assert result == Decimal("0.75")
-
-    def test_teaspoons_to_milliliters(self):
-        # Arrange
-        amount = Decimal("3")
-
-        # Act
-        result = convert_unit(amount, Unit.tsp, Unit.ml)
-
-        # Assert
-        assert result == Decimal("15")
-
-    def test_tablespoons_to_milliliters(self):
-        # Arrange
-        amount = Decimal("2")
-
-        # Act
-        result = convert_unit(amount, Unit.tbsp, Unit.ml)
-
-        # Assert
-        assert result == Decimal("30")
-
-    def test_cups_to_milliliters(self):
-        # Arrange
-        amount = Decimal("1.5")
-
-        # Act
-        result = convert_unit(amount, Unit.cup, Unit.ml)
-
-        # Assert
-        assert result == Decimal("360")
-
-    def test_tablespoons_to_teaspoons(self):
-        # Arrange
-        amount = Decimal("1")
-
-        # Act
-        result = convert_unit(amount, Unit.tbsp, Unit.tsp)
-
-        # Assert
-        assert result == Decimal("3")
-
-    def test_cups_to_tablespoons(self):
-        # Arrange
-        amount = Decimal("1")
-
-        # Act
-        result = convert_unit(amount, Unit.cup, Unit.tbsp)
-
-        # Assert
-        assert result == Decimal("16")
-
-    # Edge cases
-    def test_zero_amount(self):
-        # Arrange
-        amount = Decimal("0")
-
-        # Act
-        result = convert_unit(amount, Unit.g, Unit.kg)
-
-        # Assert
-        assert result == Decimal("0")
-
-    def test_decimal_precision(self):
-        # Arrange
-        amount = Decimal("1.23456789")
-
-        # Act
-        result = convert_unit(amount, Unit.kg, Unit.g)
-
-        # Assert
-        assert result == Decimal("1234.56789")
-
-    # Error cases
-    def test_incompatible_units_mass_to_volume_raises_error(self):
-        # Arrange
-        amount = Decimal("100")
-
-        # Act & Assert
-        with pytest.raises(ValueError, match="Incompatible units"):
-            convert_unit(amount, Unit.g, Unit.ml)
-
-    def test_incompatible_units_volume_to_mass_raises_error(self):
-        # Arrange
-        amount = Decimal("100")
-
-        # Act & Assert
+    @pytest.mark.parametrize(
+        ("amount", "from_unit", "to_unit", "expected"),
+        [
+            # Same unit
+            ("100", Unit.g, Unit.g, "100"),
+            # Mass
+            ("5", Unit.g, Unit.mg, "5000"),
+            ("1500", Unit.g, Unit.kg, "1.5"),
+            ("2.5", Unit.kg, Unit.g, "2500"),
+            ("2500000", Unit.mg, Unit.kg, "2.5"),
+            # Volume
+            ("2", Unit.l, Unit.ml, "2000"),
+            ("750", Unit.ml, Unit.l, "0.75"),
+            ("3", Unit.tsp, Unit.ml, "15"),
+            ("2", Unit.tbsp, Unit.ml, "30"),
+            ("1.5", Unit.cup, Unit.ml, "360"),
+            ("1", Unit.tbsp, Unit.tsp, "3"),
+            ("1", Unit.cup, Unit.tbsp, "16"),
+            ("48", Unit.tsp, Unit.cup, "1"),  # exact, not 0.999...
+            # Edge cases
+            ("0", Unit.g, Unit.kg, "0"),
+            ("1.23456789", Unit.kg, Unit.g, "1234.56789"),
+        ],
+    )
+    def test_converts(self, amount, from_unit, to_unit, expected):
+        assert convert_unit(Decimal(amount), from_unit, to_unit) == Decimal(expected)
+
+    @pytest.mark.parametrize(
+        ("from_unit", "to_unit"),
+        [(Unit.g, Unit.ml), (Unit.ml, Unit.kg)],
+    )
+    def test_incompatible_units_raise_error(self, from_unit, to_unit):
         with pytest.raises(ValueError, match="Incompatible units"):
-            convert_unit(amount, Unit.ml, Unit.kg)
+            convert_unit(Decimal("100"), from_unit, to_unit)
 
 
 class TestCalcTotalsForEntry:
@@ -358,7 +232,7 @@ class TestCalcTotalsForEntry:
         assert result.carbs == Decimal("100")
         assert result.fat == Decimal("25")
 
-    def test_macro_totals_dataclass_is_frozen(self):
+    def test_macro_totals_is_frozen(self):
         # Arrange
         totals = MacroTotals(
             calories=Decimal("100"),
@@ -368,7 +242,7 @@ class TestCalcTotalsForEntry:
         )
 
         # Act & Assert
-        with pytest.raises((AttributeError, Exception)):  # FrozenInstanceError varies by version
+        with pytest.raises(AttributeError):
             totals.calories = Decimal("200")
 
     def test_zero_entry_amount(self):
@@ -429,3 +303,27 @@ class TestCalcTotalsForEntry:
         assert result.protein == Decimal("20.25") * factor
         assert result.carbs == Decimal("30.75") * factor
         assert result.fat == Decimal("10.5") * factor
+
+
+class TestSumTotals:
+    """Tests for sum_totals function."""
+
+    def test_sums_each_column(self):
+        # Arrange
+        items = [
+            MacroTotals(Decimal("100"), Decimal("10"), Decimal("20"), Decimal("5")),
+            MacroTotals(Decimal("50.5"), Decimal("0"), Decimal("7.25"), Decimal("1")),
+        ]
+
+        # Act
+        result = sum_totals(items)
+
+        # Assert
+        assert result == MacroTotals(Decimal("150.5"), Decimal("10"), Decimal("27.25"), Decimal("6"))
+
+    def test_empty_returns_zero_totals(self):
+        # Act
+        result = sum_totals([])
+
+        # Assert
+        assert result == MacroTotals(Decimal("0"), Decimal("0"), Decimal("0"), Decimal("0"))
@@ -2,29 +2,47 @@
 
 from __future__ import annotations
 
+import itertools
 import uuid
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.features.catalog import service as catalog_service
 from app.features.catalog.models import CatalogPortion, CatalogProduct
 from app.features.catalog.service import (
     get_catalog_product,
+    get_catalog_product_detail,
     get_default_portion,
+    get_default_portions,
     list_catalog_products,
 )
-from tests.factories import create_catalog_product
+from tests.factories import (
+    build_catalog_product,
+    create_catalog_portion,
+    create_catalog_product,
+)
+
+# A per-run prefix keeps markers clear of rows left by earlier runs; the counter
+# makes them unique within the run without drawing a uuid4 per call.
+_RUN_PREFIX = uuid.uuid4().hex[:4]
+_MARKER_COUNTER = itertools.count()
+
+
+def _unique_marker() -> str:
+    """Return an 8-hex-char marker unique to this test run."""
+    return f"{_RUN_PREFIX}{next(_MARKER_COUNTER):04x}"
 
 
 def _unique_name(prefix: str) -> str:
     """Return a unique product name for test isolation."""
-    return f"{prefix}-{uuid.uuid4().hex[:8]}"
+    return f"{prefix}-{_unique_marker()}"
 
 
 @pytest.mark.asyncio
 async def test_list_catalog_products_returns_all(db_session: AsyncSession) -> None:
     """Basic list returns inserted products matching a search."""
-    marker = uuid.uuid4().hex[:8]
+    marker = _unique_marker()
     p1 = await create_catalog_product(
         db_session,
         name=f"ChickenBreast-{marker}",
@@ -48,7 +66,7 @@ async def test_list_catalog_products_returns_all(db_session: AsyncSession) -> No
 async def test_list_catalog_products_search_filters_by_name(db_session: AsyncSession) -> None:
     """search=<marker> returns only matching products via ILIKE fallback."""
     # Use a unique marker so we don't pick up leftovers from previous runs
-    marker = uuid.uuid4().hex[:8]
+    marker = _unique_marker()
     await create_catalog_product(
         db_session,
         name=f"HummusZZZ-{marker} Classic",
@@ -72,7 +90,7 @@ async def test_list_catalog_products_search_filters_by_name(db_session: AsyncSes
 @pytest.mark.asyncio
 async def test_list_catalog_products_search_case_insensitive(db_session: AsyncSession) -> None:
     """Search is case-insensitive."""
-    marker = uuid.uuid4().hex[:8]
+    marker = _unique_marker()
     name = f"AlmondButter-{marker}"
     await create_catalog_product(db_session, name=name, display_name=name)
     await db_session.commit()
@@ -88,13 +106,11 @@ async def test_list_catalog_products_search_case_insensitive(db_session: AsyncSe
 @pytest.mark.asyncio
 async def test_list_catalog_products_pagination(db_session: AsyncSession) -> None:
     """limit/offset works correctly."""
-    marker = uuid.uuid4().hex[:8]
-    for i in range(5):
-        await create_catalog_product(
-            db_session,
-            name=f"PaginatedItem-{marker}-{i:02d}",
-            display_name=f"PaginatedItem-{marker}-{i:02d}",
-        )
+    marker = _unique_marker()
+    # One flush inserts all five rows in a single batched INSERT
+    db_session.add_all(
+        build_catalog_product(name=f"PaginatedItem-{marker}-{i:02d}") for i in range(5)
+    )
     await db_session.commit()
 
     page1 = await list_catalog_products(
@@ -112,6 +128,29 @@ async def test_list_catalog_products_pagination(db_session: AsyncSession) -> Non
     assert page1_ids.isdisjoint(page2_ids)
 
 
+@pytest.mark.asyncio
+async def test_list_catalog_products_keyset_pagination(db_session: AsyncSession) -> None:
+    """after=<last id> continues in (display_name, id) order without overlap."""
+    marker = _unique_marker()
+    db_session.add_all(build_catalog_product(name=f"KeysetItem-{marker}-{i:02d}") for i in range(5))
+    await db_session.flush()
+
+    page1 = await list_catalog_products(db_session, search=None, limit=2)
+    page2 = await list_catalog_products(db_session, search=None, limit=2, after=page1[-1].id)
+    page3 = await list_catalog_products(db_session, search=None, limit=2, after=page2[-1].id)
+
+    names = [p.display_name for p in page1 + page2 + page3]
+    assert names == sorted(names)
+    assert len(set(names)) == 5
+
+
+@pytest.mark.asyncio
+async def test_list_catalog_products_after_rejects_ranked_search(db_session: AsyncSession) -> None:
+    """Keyset cursor is only defined for the display_name ordering."""
+    with pytest.raises(ValueError, match="ranked search"):
+        await list_catalog_products(db_session, search="apple", limit=2, after=uuid.uuid4())
+
+
 @pytest.mark.asyncio
 async def test_get_catalog_product_found(db_session: AsyncSession) -> None:
     """Returns product by id."""
@@ -135,6 +174,75 @@ async def test_get_catalog_product_not_found(db_session: AsyncSession) -> None:
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_get_catalog_product_detail_cached_after_first_lookup(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeat detail lookups are served from cache; misses are not cached."""
+    product = await create_catalog_product(db_session, name=_unique_name("Rye Bread"))
+    missing_id = uuid.uuid4()
+
+    first = await get_catalog_product_detail(db_session, catalog_product_id=product.id)
+    assert await get_catalog_product_detail(db_session, catalog_product_id=missing_id) is None
+
+    async def _no_query(*_args, **_kwargs):
+        raise AssertionError("expected a cache hit")
+
+    with monkeypatch.context() as m:
+        m.setattr(catalog_service, "get_catalog_product", _no_query)
+        assert await get_catalog_product_detail(db_session, catalog_product_id=product.id) is first
+
+    assert first is not None
+    assert first.display_name == product.display_name
+
+    late = build_catalog_product(name=_unique_name("Late Rye"))
+    late.id = missing_id
+    db_session.add(late)
+    await db_session.flush()
+    assert await get_catalog_product_detail(db_session, catalog_product_id=missing_id) is not None
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_product_loads_default_portion_first(db_session: AsyncSession) -> None:
+    """Portions come back default first, then by label."""
+    product = await create_catalog_product(db_session, name=_unique_name("Granola"))
+    for label, is_default in (("1 cup", False), ("1 bar", False), ("100 g", True)):
+        await create_catalog_portion(
+            db_session, catalog_product_id=product.id, label=label, is_default=is_default,
+        )
+    await db_session.commit()
+    product_id = product.id
+    db_session.expire(product)  # reload portions through the relationship's ORDER BY
+
+    result = await get_catalog_product(db_session, catalog_product_id=product_id)
+
+    assert result is not None
+    assert [p.label for p in result.portions] == ["100 g", "1 bar", "1 cup"]
+    assert get_default_portion(result) is result.portions[0]
+
+
+@pytest.mark.asyncio
+async def test_get_default_portions_maps_products_with_a_default(db_session: AsyncSession) -> None:
+    """Only default portions are returned, keyed by product id."""
+    with_default = await create_catalog_product(db_session, name=_unique_name("Muesli"))
+    without_default = await create_catalog_product(db_session, name=_unique_name("Bran"))
+    default = await create_catalog_portion(
+        db_session, catalog_product_id=with_default.id, label="100 g", is_default=True,
+    )
+    await create_catalog_portion(
+        db_session, catalog_product_id=with_default.id, label="1 cup", is_default=False,
+    )
+    await create_catalog_portion(
+        db_session, catalog_product_id=without_default.id, label="1 cup", is_default=False,
+    )
+
+    result = await get_default_portions(
+        db_session, catalog_product_ids=[with_default.id, without_default.id],
+    )
+
+    assert result == {with_default.id: default}
+
+
 def test_get_default_portion_returns_default() -> None:
     """Returns the portion with is_default=True."""
     product = CatalogProduct(
@@ -194,7 +302,7 @@ def test_get_default_portion_returns_none_when_no_portions() -> None:
 @pytest.mark.asyncio
 async def test_list_catalog_products_tsvector_search(db_session: AsyncSession) -> None:
     """Tsvector search: 'chicken' finds 'Chicken breast, grilled' via stemming."""
-    marker = uuid.uuid4().hex[:8]
+    marker = _unique_marker()
     await create_catalog_product(
         db_session,
         name=f"Chicken breast grilled {marker}",
@@ -218,7 +326,7 @@ async def test_list_catalog_products_tsvector_search(db_session: AsyncSession) -
 @pytest.mark.asyncio
 async def test_list_catalog_products_tsvector_fallback_to_ilike(db_session: AsyncSession) -> None:
     """ILIKE catches terms that tsvector doesn't stem well (combined query)."""
-    marker = uuid.uuid4().hex[:8]
+    marker = _unique_marker()
     # Create a product with a brand-like name that won't stem well
     await create_catalog_product(
         db_session,
@@ -239,7 +347,7 @@ async def test_list_catalog_products_tsvector_fallback_to_ilike(db_session: Asyn
 @pytest.mark.asyncio
 async def test_list_catalog_products_short_query_uses_ilike(db_session: AsyncSession) -> None:
     """2-char query uses ILIKE directly (too short for tsvector)."""
-    marker = uuid.uuid4().hex[:8]
+    marker = _unique_marker()
     await create_catalog_product(
         db_session,
         name=f"QZ{marker} Snack",
@@ -260,7 +368,7 @@ async def test_list_catalog_products_short_query_uses_ilike(db_session: AsyncSes
 @pytest.mark.asyncio
 async def test_list_catalog_products_search_by_brand(db_session: AsyncSession) -> None:
     """Tsvector search finds product via brand field."""
-    marker = uuid.uuid4().hex[:8]
+    marker = _unique_marker()
     await create_catalog_product(
         db_session,
         name=f"Granola Bar {marker}",
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import uuid
-from datetime import date, timedelta
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
+from types import MappingProxyType
+from typing import NamedTuple
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
 
 from app.core.enums import MealType, Unit
+from app.features.auth.models import Device
+from app.features.meals.schemas import FoodEntryResponse
 from app.features.meals.service import (
     create_food_entry,
     get_food_entry,
@@ -17,70 +23,163 @@ from app.features.meals.service import (
     soft_delete_food_entry,
     update_food_entry,
 )
-from tests.factories import create_device, create_portion, create_product
+from app.features.portions.models import ProductPortion
+from app.features.products.models import Product
+from tests.factories import (
+    build_device,
+    build_food_entry,
+    build_portion,
+    build_product,
+    create_device,
+    create_portion,
+    create_product,
+    persist_all,
+)
 from tests.factories import create_food_entry as factory_create_entry
 
+TODAY = date.today()
+YESTERDAY = TODAY - timedelta(days=1)
+TWO_DAYS_AGO = TODAY - timedelta(days=2)
+
+# Shared create_food_entry kwargs, built once for the module
+_ENTRY_FIELDS = MappingProxyType({
+    "day": TODAY,
+    "meal_type": MealType.breakfast,
+    "amount": Decimal("100"),
+    "unit": Unit.g,
+})
+
+
+class Baseline(NamedTuple):
+    device: Device
+    product: Product
+    portion: ProductPortion
+
+
+@pytest_asyncio.fixture(scope="module")
+async def module_connection(test_engine: AsyncEngine) -> AsyncIterator[AsyncConnection]:
+    """One connection for the module, holding a transaction rolled back at the end."""
+    async with test_engine.connect() as conn:
+        outer = await conn.begin()
+        try:
+            yield conn
+        finally:
+            await outer.rollback()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def baseline(module_connection: AsyncConnection) -> Baseline:
+    """Device/product/portion inserted once per module, visible to every test in it."""
+    device = build_device()
+    product = build_product(device.id)
+    portion = build_portion(device.id, product.id)
+    async with AsyncSession(bind=module_connection, expire_on_commit=False) as session:
+        await persist_all(session, device, product, portion)
+    return Baseline(device, product, portion)
+
+
+class ListingCorpus(NamedTuple):
+    device_id: uuid.UUID
+    entry_ids: dict[str, uuid.UUID]
+
+
+@pytest_asyncio.fixture(scope="module")
+async def listing_corpus(module_connection: AsyncConnection) -> ListingCorpus:
+    """A device with entries today, yesterday, two days ago, plus a soft-deleted one today.
+
+    It gets its own device so tests on the baseline device still start empty.
+    """
+    device = build_device()
+    product = build_product(device.id)
+    portion = build_portion(device.id, product.id)
+    entries = {
+        "today": build_food_entry(device.id, product.id, portion.id, day=TODAY),
+        "yesterday": build_food_entry(device.id, product.id, portion.id, day=YESTERDAY),
+        "two_days_ago": build_food_entry(device.id, product.id, portion.id, day=TWO_DAYS_AGO),
+        "deleted": build_food_entry(
+            device.id, product.id, portion.id, day=TODAY, deleted_at=datetime.now(UTC),
+        ),
+    }
+    async with AsyncSession(bind=module_connection, expire_on_commit=False) as session:
+        await persist_all(session, device, product, portion, *entries.values())
+    return ListingCorpus(device.id, {name: entry.id for name, entry in entries.items()})
+
+
+@pytest_asyncio.fixture
+async def db_session(module_connection: AsyncConnection) -> AsyncIterator[AsyncSession]:
+    """Per-test session nested in a SAVEPOINT on the module connection.
+
+    Same isolation as the conftest fixture (services' commits release inner
+    savepoints, the test's SAVEPOINT is rolled back afterwards), but the
+    module's ``baseline`` rows survive from test to test.
+    """
+    savepoint = await module_connection.begin_nested()
+    session = AsyncSession(
+        bind=module_connection,
+        expire_on_commit=False,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+    try:
+        yield session
+    finally:
+        await session.close()
+        await savepoint.rollback()
+
 
 @pytest.mark.asyncio
-async def test_create_food_entry_success(db_session: AsyncSession):
+async def test_create_food_entry_success(
+    db_session: AsyncSession, baseline: Baseline, sql_statements: list[str],
+):
     """Test creating a food entry."""
-    device = await create_device(db_session)
-    product = await create_product(db_session, device.id)
-    portion = await create_portion(db_session, device.id, product.id)
+    device, product, portion = baseline
 
     entry = await create_food_entry(
         db_session,
         device_id=device.id,
         product_id=product.id,
         portion_id=portion.id,
-        day=date.today(),
-        meal_type=MealType.breakfast,
-        amount=Decimal("100"),
-        unit=Unit.g,
+        **_ENTRY_FIELDS,
     )
 
     assert entry is not None
     assert entry.product_id == product.id
     assert entry.portion_id == portion.id
     assert entry.meal_type == MealType.breakfast
+    assert entry.created_at is not None
+    # product check, portion check, INSERT. Both checks hit the database
+    # because conftest empties the ownership caches before every test, so the
+    # count does not depend on which tests ran earlier against this product.
+    assert len(sql_statements) == 3
 
 
 @pytest.mark.asyncio
-async def test_create_food_entry_product_not_found(db_session: AsyncSession):
+async def test_create_food_entry_product_not_found(db_session: AsyncSession, baseline: Baseline):
     """Test creating entry for non-existent product returns None."""
-    device = await create_device(db_session)
-    product = await create_product(db_session, device.id)
-    portion = await create_portion(db_session, device.id, product.id)
+    device, _product, portion = baseline
 
     result = await create_food_entry(
         db_session,
         device_id=device.id,
         product_id=uuid.uuid4(),
         portion_id=portion.id,
-        day=date.today(),
-        meal_type=MealType.breakfast,
-        amount=Decimal("100"),
-        unit=Unit.g,
+        **_ENTRY_FIELDS,
     )
 
     assert result is None
 
 
 @pytest.mark.asyncio
-async def test_create_food_entry_portion_not_found(db_session: AsyncSession):
+async def test_create_food_entry_portion_not_found(db_session: AsyncSession, baseline: Baseline):
     """Test creating entry for non-existent portion returns None."""
-    device = await create_device(db_session)
-    product = await create_product(db_session, device.id)
+    device, product, _portion = baseline
 
     result = await create_food_entry(
         db_session,
         device_id=device.id,
         product_id=product.id,
         portion_id=uuid.uuid4(),
-        day=date.today(),
-        meal_type=MealType.breakfast,
-        amount=Decimal("100"),
-        unit=Unit.g,
+        **_ENTRY_FIELDS,
     )
 
     assert result is None
@@ -99,10 +198,7 @@ async def test_create_food_entry_portion_wrong_product(db_session: AsyncSession)
         device_id=device.id,
         product_id=product2.id,
         portion_id=portion.id,
-        day=date.today(),
-        meal_type=MealType.breakfast,
-        amount=Decimal("100"),
-        unit=Unit.g,
+        **_ENTRY_FIELDS,
     )
 
     assert result is None
@@ -121,101 +217,86 @@ async def test_create_food_entry_wrong_device(db_session: AsyncSession):
         device_id=device2.id,
         product_id=product.id,
         portion_id=portion.id,
-        day=date.today(),
-        meal_type=MealType.breakfast,
-        amount=Decimal("100"),
-        unit=Unit.g,
+        **_ENTRY_FIELDS,
     )
 
     assert result is None
 
 
 @pytest.mark.asyncio
-async def test_list_food_entries_empty(db_session: AsyncSession):
+async def test_list_food_entries_empty(db_session: AsyncSession, baseline: Baseline):
     """Test listing entries when there are none."""
-    device = await create_device(db_session)
+    device = baseline.device
 
     entries = await list_food_entries(db_session, device_id=device.id)
 
     assert entries == []
 
 
-@pytest.mark.asyncio
-async def test_list_food_entries_by_day(db_session: AsyncSession):
-    """Test filtering entries by day."""
-    device = await create_device(db_session)
-    product = await create_product(db_session, device.id)
-    portion = await create_portion(db_session, device.id, product.id)
-
-    today = date.today()
-    yesterday = today - timedelta(days=1)
-
-    await factory_create_entry(db_session, device.id, product.id, portion.id, day=today)
-    await factory_create_entry(db_session, device.id, product.id, portion.id, day=yesterday)
-
-    entries = await list_food_entries(db_session, device_id=device.id, day=today)
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        pytest.param({"day": TODAY}, ["today"], id="by_day"),
+        pytest.param(
+            {"from_day": YESTERDAY, "to_day": TODAY}, ["today", "yesterday"], id="date_range",
+        ),
+        pytest.param({}, ["today", "yesterday", "two_days_ago"], id="excludes_deleted"),
+    ],
+)
+async def test_list_food_entries_filters(
+    db_session: AsyncSession,
+    listing_corpus: ListingCorpus,
+    filters: dict[str, date],
+    expected: list[str],
+    sql_statements: list[str],
+):
+    """Day filters and soft-delete exclusion, checked against one shared set of entries."""
+    entries = await list_food_entries(db_session, device_id=listing_corpus.device_id, **filters)
 
-    assert len(entries) == 1
-    assert entries[0].day == today
+    assert [e.id for e in entries] == [listing_corpus.entry_ids[name] for name in expected]
+    assert len(sql_statements) == 1
 
 
 @pytest.mark.asyncio
-async def test_list_food_entries_date_range(db_session: AsyncSession):
-    """Test filtering entries by date range."""
-    device = await create_device(db_session)
-    product = await create_product(db_session, device.id)
-    portion = await create_portion(db_session, device.id, product.id)
-
-    today = date.today()
-    yesterday = today - timedelta(days=1)
-    two_days_ago = today - timedelta(days=2)
-
-    await factory_create_entry(db_session, device.id, product.id, portion.id, day=today)
-    await factory_create_entry(db_session, device.id, product.id, portion.id, day=yesterday)
-    await factory_create_entry(db_session, device.id, product.id, portion.id, day=two_days_ago)
-
-    entries = await list_food_entries(
-        db_session, device_id=device.id,
-        from_day=yesterday, to_day=today
+async def test_list_food_entries_no_n_plus_one(
+    db_session: AsyncSession, baseline: Baseline, sql_statements: list[str],
+):
+    """Listing and serializing many entries is a single SELECT."""
+    device, product, portion = baseline
+    await persist_all(
+        db_session, *(build_food_entry(device.id, product.id, portion.id) for _ in range(50)),
     )
-
-    assert len(entries) == 2
-    days = [e.day for e in entries]
-    assert today in days
-    assert yesterday in days
-    assert two_days_ago not in days
-
-
-@pytest.mark.asyncio
-async def test_list_food_entries_excludes_deleted(db_session: AsyncSession):
-    """Test that soft-deleted entries are not listed."""
-    device = await create_device(db_session)
-    product = await create_product(db_session, device.id)
-    portion = await create_portion(db_session, device.id, product.id)
-
-    entry1 = await factory_create_entry(db_session, device.id, product.id, portion.id)
-    entry2 = await factory_create_entry(db_session, device.id, product.id, portion.id)
-
-    await soft_delete_food_entry(db_session, device_id=device.id, entry_id=entry2.id)
+    db_session.expunge_all()
+    sql_statements.clear()
 
     entries = await list_food_entries(db_session, device_id=device.id)
+    payload = [FoodEntryResponse.model_validate(entry) for entry in entries]
 
-    assert len(entries) == 1
-    assert entries[0].id == entry1.id
+    assert len(payload) == 50
+    assert len(sql_statements) == 1
 
 
 @pytest.mark.asyncio
 async def test_list_food_entries_device_scoped(db_session: AsyncSession):
     """Test that entries are scoped by device."""
-    device1 = await create_device(db_session)
-    device2 = await create_device(db_session)
-    product1 = await create_product(db_session, device1.id)
-    product2 = await create_product(db_session, device2.id)
-    portion1 = await create_portion(db_session, device1.id, product1.id)
-    portion2 = await create_portion(db_session, device2.id, product2.id)
-
-    await factory_create_entry(db_session, device1.id, product1.id, portion1.id)
-    await factory_create_entry(db_session, device2.id, product2.id, portion2.id)
+    device1 = build_device()
+    device2 = build_device()
+    product1 = build_product(device1.id)
+    product2 = build_product(device2.id)
+    portion1 = build_portion(device1.id, product1.id)
+    portion2 = build_portion(device2.id, product2.id)
+
+    await persist_all(
+        db_session,
+        device1,
+        device2,
+        product1,
+        product2,
+        portion1,
+        portion2,
+        build_food_entry(device1.id, product1.id, portion1.id),
+        build_food_entry(device2.id, product2.id, portion2.id),
+    )
 
     entries1 = await list_food_entries(db_session, device_id=device1.id)
     entries2 = await list_food_entries(db_session, device_id=device2.id)
@@ -227,11 +308,9 @@ async def test_list_food_entries_device_scoped(db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_get_food_entry_found(db_session: AsyncSession):
+async def test_get_food_entry_found(db_session: AsyncSession, baseline: Baseline):
     """Test getting a food entry by ID."""
-    device = await create_device(db_session)
-    product = await create_product(db_session, device.id)
-    portion = await create_portion(db_session, device.id, product.id)
+    device, product, portion = baseline
     entry = await factory_create_entry(db_session, device.id, product.id, portion.id)
 
     result = await get_food_entry(db_session, device_id=device.id, entry_id=entry.id)
@@ -241,9 +320,9 @@ async def test_get_food_entry_found(db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_get_food_entry_not_found(db_session: AsyncSession):
+async def test_get_food_entry_not_found(db_session: AsyncSession, baseline: Baseline):
     """Test getting a non-existent entry."""
-    device = await create_device(db_session)
+    device = baseline.device
 
     result = await get_food_entry(db_session, device_id=device.id, entry_id=uuid.uuid4())
 
@@ -265,11 +344,9 @@ async def test_get_food_entry_wrong_device(db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_get_food_entry_deleted(db_session: AsyncSession):
+async def test_get_food_entry_deleted(db_session: AsyncSession, baseline: Baseline):
     """Test that soft-deleted entries cannot be retrieved."""
-    device = await create_device(db_session)
-    product = await create_product(db_session, device.id)
-    portion = await create_portion(db_session, device.id, product.id)
+    device, product, portion = baseline
     entry = await factory_create_entry(db_session, device.id, product.id, portion.id)
 
     await soft_delete_food_entry(db_session, device_id=device.id, entry_id=entry.id)
@@ -280,15 +357,15 @@ async def test_get_food_entry_deleted(db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_update_food_entry_success(db_session: AsyncSession):
+async def test_update_food_entry_success(
+    db_session: AsyncSession, baseline: Baseline, sql_statements: list[str],
+):
     """Test updating a food entry."""
-    device = await create_device(db_session)
-    product = await create_product(db_session, device.id)
-    portion = await create_portion(db_session, device.id, product.id)
+    device, product, portion = baseline
     entry = await factory_create_entry(
-        db_session, device.id, product.id, portion.id,
-        amount=Decimal("100")
+        db_session, device.id, product.id, portion.id, **_ENTRY_FIELDS,
     )
+    sql_statements.clear()
 
     updated = await update_food_entry(
         db_session,
@@ -299,6 +376,8 @@ async def test_update_food_entry_success(db_session: AsyncSession):
 
     assert updated is not None
     assert updated.amount == Decimal("200")
+    # lookup, UPDATE, refresh after commit
+    assert len(sql_statements) == 3
 
 
 @pytest.mark.asyncio
@@ -322,23 +401,58 @@ async def test_update_food_entry_portion_validation(db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_soft_delete_food_entry_success(db_session: AsyncSession):
+async def test_soft_delete_food_entry_success(
+    db_session: AsyncSession, baseline: Baseline, sql_statements: list[str],
+):
     """Test soft deleting a food entry."""
-    device = await create_device(db_session)
-    product = await create_product(db_session, device.id)
-    portion = await create_portion(db_session, device.id, product.id)
+    device, product, portion = baseline
     entry = await factory_create_entry(db_session, device.id, product.id, portion.id)
+    sql_statements.clear()
 
     result = await soft_delete_food_entry(db_session, device_id=device.id, entry_id=entry.id)
 
     assert result is True
+    assert len(sql_statements) == 2  # lookup, UPDATE
 
 
 @pytest.mark.asyncio
-async def test_soft_delete_food_entry_not_found(db_session: AsyncSession):
+async def test_soft_delete_food_entry_not_found(db_session: AsyncSession, baseline: Baseline):
     """Test soft deleting a non-existent entry."""
-    device = await create_device(db_session)
+    device = baseline.device
 
     result = await soft_delete_food_entry(db_session, device_id=device.id, entry_id=uuid.uuid4())
 
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_persist_all_inserts_chain_in_dependency_order(db_session: AsyncSession):
+    """Factories built without a session persist together, parents first."""
+    device = build_device()
+    product = build_product(device.id)
+    portion = build_portion(device.id, product.id)
+    entry = build_food_entry(device.id, product.id, portion.id)
+
+    await persist_all(db_session, entry, portion, product, device)
+
+    fetched = await get_food_entry(db_session, device_id=device.id, entry_id=entry.id)
+    assert fetched is not None
+    assert fetched.portion_id == portion.id
+    assert entry.created_at is not None
+
+
+@pytest.mark.asyncio
+async def test_persist_all_sends_one_insert_per_table(
+    db_session: AsyncSession, sql_statements: list[str],
+):
+    """Client-side ids let each table's rows share one INSERT, with no refresh SELECTs."""
+    device = build_device()
+    product = build_product(device.id)
+    portion = build_portion(device.id, product.id)
+    entries = [build_food_entry(device.id, product.id, portion.id) for _ in range(3)]
+
+    await persist_all(db_session, device, product, portion, *entries)
+
+    assert [stmt.split()[2] for stmt in sql_statements] == [
+        "devices", "products", "product_portions", "food_entries",
+    ]
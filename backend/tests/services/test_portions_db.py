@@ -6,13 +6,16 @@ import uuid
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.enums import Unit
+from app.features.portions.models import ProductPortion
 from app.features.portions.service import (
     PortionConflict,
     create_portion,
     get_portion,
+    iter_portions,
     list_portions,
     soft_delete_portion,
     update_portion,
@@ -166,6 +169,49 @@ async def test_list_portions_ordered(db_session: AsyncSession):
     assert portions[2].label == "C portion"
 
 
+@pytest.mark.asyncio
+async def test_iter_portions_ordered(db_session: AsyncSession):
+    """Test that streamed portions keep the list ordering (default first, then label)."""
+    device = await create_device(db_session)
+    product = await create_product(db_session, device.id)
+
+    await factory_create_portion(
+        db_session, device.id, product.id, label="B portion", is_default=False
+    )
+    await factory_create_portion(
+        db_session, device.id, product.id, label="A portion", is_default=True
+    )
+
+    labels = [
+        p.label
+        async for p in iter_portions(db_session, device_id=device.id, product_id=product.id)
+    ]
+
+    assert labels == ["A portion", "B portion"]
+
+
+@pytest.mark.asyncio
+async def test_list_portions_fields_loads_only_requested_columns(db_session: AsyncSession):
+    """Test that fields= trims the SELECT to the requested columns."""
+    device = await create_device(db_session)
+    product = await create_product(db_session, device.id)
+    await factory_create_portion(db_session, device.id, product.id, is_default=True)
+    db_session.expunge_all()
+
+    portions = await list_portions(
+        db_session,
+        device_id=device.id,
+        product_id=product.id,
+        fields=(ProductPortion.id, ProductPortion.label, ProductPortion.is_default),
+    )
+
+    assert len(portions) == 1
+    unloaded = inspect(portions[0]).unloaded
+    assert "calories" in unloaded
+    assert "label" not in unloaded
+    assert portions[0].is_default is True
+
+
 @pytest.mark.asyncio
 async def test_list_portions_excludes_deleted(db_session: AsyncSession):
     """Test that soft-deleted portions are not listed."""
@@ -284,6 +330,9 @@ async def test_update_portion_set_default(db_session: AsyncSession):
 
     assert updated.is_default is True
     assert portion1.is_default is False
+    # Stamped at write time, not at the (earlier) start of the test transaction
+    assert portion1.updated_at >= portion1.created_at
+    assert updated.updated_at >= updated.created_at
 
 
 @pytest.mark.asyncio
@@ -6,15 +6,19 @@ import uuid
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.enums import Unit
 from app.features.catalog.models import CatalogPortion, CatalogProduct
+from app.features.products.models import Product
 from app.features.products.service import (
     check_product_name_available,
     create_product,
     get_product,
+    iter_products,
     list_products,
+    product_exists,
     search_products,
     soft_delete_product,
     update_product,
@@ -73,6 +77,18 @@ async def test_list_products_alphabetical(db_session: AsyncSession):
     assert products[2].name == "Carrot"
 
 
+@pytest.mark.asyncio
+async def test_iter_products_alphabetical(db_session: AsyncSession):
+    """Test that streamed products are yielded in alphabetical order."""
+    device = await create_device(db_session)
+    await create_product(db_session, device_id=device.id, name="Carrot")
+    await create_product(db_session, device_id=device.id, name="Apple")
+
+    names = [p.name async for p in iter_products(db_session, device_id=device.id)]
+
+    assert names == ["Apple", "Carrot"]
+
+
 @pytest.mark.asyncio
 async def test_list_products_excludes_deleted(db_session: AsyncSession):
     """Test that soft-deleted products are not listed."""
@@ -211,6 +227,24 @@ async def test_soft_delete_product_not_found(db_session: AsyncSession):
     assert result is False
 
 
+@pytest.mark.asyncio
+async def test_product_exists_sees_deletion_from_elsewhere(db_session: AsyncSession):
+    """Test that product_exists is not fooled by an earlier hit once the row is deleted.
+
+    The delete bypasses soft_delete_product, as one committed by another worker would.
+    """
+    device = await create_device(db_session)
+    product = await create_product(db_session, device_id=device.id, name="Gone")
+
+    assert await product_exists(db_session, device_id=device.id, product_id=product.id)
+
+    await db_session.execute(
+        update(Product).where(Product.id == product.id).values(deleted_at=func.now())
+    )
+
+    assert not await product_exists(db_session, device_id=device.id, product_id=product.id)
+
+
 @pytest.mark.asyncio
 async def test_check_name_available_true(db_session: AsyncSession):
     """No matching product → available=True."""
@@ -14,6 +14,7 @@ from app.features.weights.service import (
     create_body_weight,
     get_body_weight,
     get_body_weight_by_day,
+    iter_body_weights,
     list_body_weights,
     soft_delete_body_weight,
     update_body_weight,
@@ -116,6 +117,23 @@ async def test_list_body_weights_ordered(db_session: AsyncSession):
     assert weights[1].day == today
 
 
+@pytest.mark.asyncio
+async def test_iter_body_weights_matches_list(db_session: AsyncSession):
+    """Test that streaming weights yields the same rows, in order, as the list variant."""
+    device = await create_device(db_session)
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+
+    await factory_create_weight(db_session, device.id, day=today, weight_kg=Decimal("75"))
+    await factory_create_weight(db_session, device.id, day=yesterday, weight_kg=Decimal("76"))
+
+    streamed = [w async for w in iter_body_weights(db_session, device_id=device.id)]
+    listed = await list_body_weights(db_session, device_id=device.id)
+
+    assert [w.id for w in streamed] == [w.id for w in listed]
+    assert streamed[0].day == yesterday
+
+
 @pytest.mark.asyncio
 async def test_list_body_weights_device_scoped(db_session: AsyncSession):
     """Test that weights are scoped by device."""